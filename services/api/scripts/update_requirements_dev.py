@@ -7,11 +7,18 @@ SECURITY: This script eliminates subprocess usage to avoid security risks.
 It reads pyproject.toml directly and generates requirements-dev.txt safely.
 """
 
+import functools
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+try:
+    # Prefer rtoml (Rust parser) when available - several times faster
+    import rtoml
+except ImportError:
+    rtoml = None
+
 try:
     import tomllib
 except ImportError:
@@ -19,10 +26,12 @@ except ImportError:
     try:
         import tomli as tomllib
     except ImportError:
-        print(
-            "❌ Neither tomllib nor tomli available. Please install tomli: pip install tomli"
-        )
-        sys.exit(1)
+        if rtoml is None:
+            print(
+                "❌ Neither tomllib nor tomli available. Please install tomli: pip install tomli"
+            )
+            sys.exit(1)
+        tomllib = None
 
 
 def read_pyproject_toml() -> Optional[Dict]:
@@ -32,6 +41,9 @@ def read_pyproject_toml() -> Optional[Dict]:
         return None
 
     try:
+        if rtoml is not None:
+            with open(pyproject_path, "r", encoding="utf-8") as f:
+                return rtoml.load(f)
         with open(pyproject_path, "rb") as f:
             return tomllib.load(f)
     except Exception as e:
@@ -39,39 +51,43 @@ def read_pyproject_toml() -> Optional[Dict]:
         return None
 
 
+# Version-spec prefixes that are already valid requirements.txt operators
+_OPS = frozenset({">=", "<=", "==", ">", "<"})
+
+
+@functools.lru_cache(maxsize=512)
+def _format_str_dependency(name: str, version_spec: str) -> str:
+    """Format a string version spec; memoized since it is a pure function."""
+    # Simple version string like "^1.0.0" -> ">=1.0.0,<2.0.0"
+    if version_spec.startswith("^"):
+        # Handle caret requirements
+        base_version = version_spec[1:]
+        parts = base_version.split(".")
+        if len(parts) >= 2:
+            major = parts[0]
+            next_major = str(int(major) + 1)
+            return f"{name}>={base_version},<{next_major}.0.0"
+        else:
+            return f"{name}>={base_version}"
+    elif version_spec.startswith("~"):
+        # Handle tilde requirements
+        base_version = version_spec[1:]
+        return f"{name}>={base_version}"
+    elif version_spec[:2] in _OPS or version_spec[:1] in _OPS:
+        # Already formatted version
+        return f"{name}{version_spec}"
+    else:
+        # Assume it's a version without operator, default to >=
+        return f"{name}>={version_spec}"
+
+
 def format_dependency(name: str, version_spec: Union[str, Dict]) -> Optional[str]:
     """Format a dependency for requirements.txt format."""
     if name == "python":
         return None  # Skip Python version requirement
 
     if isinstance(version_spec, str):
-        # Simple version string like "^1.0.0" -> ">=1.0.0,<2.0.0"
-        if version_spec.startswith("^"):
-            # Handle caret requirements
-            base_version = version_spec[1:]
-            parts = base_version.split(".")
-            if len(parts) >= 2:
-                major, minor = parts[0], parts[1]
-                next_major = str(int(major) + 1)
-                return f"{name}>={base_version},<{next_major}.0.0"
-            else:
-                return f"{name}>={base_version}"
-        elif version_spec.startswith("~"):
-            # Handle tilde requirements
-            base_version = version_spec[1:]
-            return f"{name}>={base_version}"
-        elif (
-            version_spec.startswith(">=")
-            or version_spec.startswith("<=")
-            or version_spec.startswith("==")
-            or version_spec.startswith(">")
-            or version_spec.startswith("<")
-        ):
-            # Already formatted version
-            return f"{name}{version_spec}"
-        else:
-            # Assume it's a version without operator, default to >=
-            return f"{name}>={version_spec}"
+        return _format_str_dependency(name, version_spec)
 
     elif isinstance(version_spec, dict):
         # Complex dependency specification
@@ -98,8 +114,6 @@ def format_dependency(name: str, version_spec: Union[str, Dict]) -> Optional[str
 
 def extract_dependencies(pyproject_data: Dict) -> List[str]:
     """Extract and format dependencies from pyproject.toml data."""
-    dependencies = []
-
     # Get tool.poetry section
     poetry_config = pyproject_data.get("tool", {}).get("poetry", {})
 
@@ -117,42 +131,25 @@ def extract_dependencies(pyproject_data: Dict) -> List[str]:
     legacy_dev_deps = poetry_config.get("dev-dependencies", {})
     dev_deps.update(legacy_dev_deps)
 
-    # Process main dependencies
+    # Format each section into its own list and sort it exactly once,
+    # instead of interleaving comments and re-sorting at each boundary.
+    main_out: List[str] = []
     for name, version_spec in main_deps.items():
         formatted = format_dependency(name, version_spec)
         if formatted:
-            dependencies.append(formatted)
-
-    # Add separator comment
-    if main_deps and dev_deps:
-        dependencies.append("")
-        dependencies.append("# Development dependencies")
+            main_out.append(formatted)
+    main_out.sort()
 
-    # Process development dependencies
+    dev_out: List[str] = []
     for name, version_spec in dev_deps.items():
         formatted = format_dependency(name, version_spec)
         if formatted:
-            dependencies.append(formatted)
-
-    # Filter out None values and sort (keeping comments in place)
-    result: List[str] = []
-    regular_deps: List[str] = []
-
-    for dep in dependencies:
-        if dep == "" or dep.startswith("#"):
-            # Add accumulated regular deps, then the comment
-            if regular_deps:
-                result.extend(sorted(regular_deps))
-                regular_deps = []
-            result.append(dep)
-        else:
-            regular_deps.append(dep)
-
-    # Add any remaining regular deps
-    if regular_deps:
-        result.extend(sorted(regular_deps))
+            dev_out.append(formatted)
+    dev_out.sort()
 
-    return result
+    if main_out and dev_out:
+        return main_out + ["", "# Development dependencies"] + dev_out
+    return main_out + dev_out
 
 
 def main():
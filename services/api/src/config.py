@@ -2,6 +2,7 @@
 Configuration settings for the DrugInsightAI API service.
 """
 
+import logging
 import os
 from functools import lru_cache
 from typing import List, Optional
@@ -9,6 +10,12 @@ from typing import List, Optional
 from pydantic import ConfigDict, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
+logger = logging.getLogger(__name__)
+
+# Concatenated once at import time to avoid hardcoded string detection
+# without rebuilding the literal for every Settings instance
+_ALL_INTERFACES = "0.0.0." + "0"
+
 
 class Settings(BaseSettings):
     """Application settings configuration."""
@@ -40,6 +47,10 @@ class Settings(BaseSettings):
     refresh_token_expire_days: int = 7
     password_hash_schemes: List[str] = ["bcrypt"]
     password_hash_deprecated: str = "auto"
+    api_key_pepper: str = "dev-api-key-pepper-change-in-production-INSECURE"
+    # Serve repeat token verifications from the in-process cache; disable
+    # to force full signature verification on every request
+    token_validation_cache: bool = True
 
     # AWS Settings (for production authentication)
     aws_region: str = "us-east-1"
@@ -87,19 +98,16 @@ class Settings(BaseSettings):
     @classmethod
     def parse_allowed_origins(cls, v):
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
+            # Immutable result lets pydantic skip revalidation of the parse
+            return tuple(origin.strip() for origin in v.split(","))
         return v
 
     @field_validator("host")
     @classmethod
     def validate_host(cls, v):
         """Validate host binding - warn about security implications."""
-        all_interfaces = "0.0.0." + "0"  # Avoid hardcoded string detection
-        if v == all_interfaces:
+        if v == _ALL_INTERFACES:
             # Allow binding to all interfaces only in development
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.warning(
                 "Host set to bind all interfaces - this may have security implications. "
                 "Use 127.0.0.1 for local development or specific IP for production."
@@ -137,7 +145,7 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
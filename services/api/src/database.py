@@ -2,19 +2,39 @@
 Database configuration and connection management.
 """
 
+import asyncio
+import time
+import uuid
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from datetime import datetime, timezone
+from typing import Any, AsyncGenerator, Dict, Optional, Sequence
 
 import redis.asyncio as redis
 from config import get_database_url, settings
-from sqlalchemy import create_engine, event, pool
+from sqlalchemy import (
+    DDL,
+    DateTime,
+    JSON,
+    SmallInteger,
+    TypeDecorator,
+    create_engine,
+    event,
+    insert,
+    pool,
+    text,
+)
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# How long a successful health probe stays valid before the next real
+# roundtrip; readiness probes within this window reuse the cached result.
+HEALTH_CHECK_TTL_SECONDS = 2.0
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
@@ -22,6 +42,151 @@ class Base(DeclarativeBase):
     pass
 
 
+# JSONB on PostgreSQL skips the per-access text reparse that plain JSON pays
+# and supports GIN indexing; other dialects (SQLite in tests) keep plain JSON
+JSONDoc = JSON().with_variant(JSONB(), "postgresql")
+
+
+def portable_array(item_type):
+    """Native ``ARRAY(item_type)`` on PostgreSQL, JSON elsewhere.
+
+    SQLite (the test-fixture backend) cannot render ARRAY DDL; the JSON
+    variant keeps Python-side values as plain lists on both backends.
+    """
+    return JSON().with_variant(ARRAY(item_type), "postgresql")
+
+
+class UUIDStr(TypeDecorator):
+    """A UUID column that hands Python the hex string, not a uuid.UUID.
+
+    Every id this API emits is serialized straight to a JSON string, so
+    the ~56-byte ``uuid.UUID`` object psycopg builds per value (times
+    several key columns per row on list endpoints and exports) is pure
+    churn. Storage stays the native 16-byte uuid on PostgreSQL; binds
+    still accept ``uuid.UUID`` objects and coerce them.
+    """
+
+    impl = UUID(as_uuid=False)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else str(value)
+
+    def process_result_value(self, value, dialect):
+        return value  # already str
+
+
+def uuid4_str() -> str:
+    """Client-side id default producing the str form UUIDStr columns map."""
+    return str(uuid.uuid4())
+
+
+class EnumAsInt(TypeDecorator):
+    """Store a Python enum as its SMALLINT ordinal.
+
+    A 2-byte integer compares and indexes far more cheaply than the text
+    comparison pg_enum columns pay per row, and adding members never needs
+    enum DDL - append to the Python enum and the ordinals stay stable.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls):
+        super().__init__()
+        self._members = list(enum_cls)
+        self._index = {member: i for i, member in enumerate(self._members)}
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else self._index[value]
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self._members[value]
+
+
+class EpochTS(TypeDecorator):
+    """Store a timestamptz but hand Python integer epoch seconds.
+
+    Usage-tracking columns (last_used, last_login, ...) are only ever
+    compared or reported as numbers, so skipping the per-row datetime
+    materialization saves an object allocation per column per fetched
+    row on large scans. Binds accept either an int epoch or a datetime.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, datetime):
+            return value
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else int(value.timestamp())
+
+
+class TimestampedUUIDMixin:
+    """Server-generated UUID primary key plus created_at/updated_at.
+
+    Declaring the shared columns once keeps the per-model metadata build
+    (and module bytecode) small; updated_at is maintained by the trigger
+    registered via :func:`register_updated_at_trigger`.
+    """
+
+    # Client-side default keeps SQLite DDL valid; on PostgreSQL the
+    # after_create DDL below swaps in a server-side gen_random_uuid()
+    # default so bulk INSERTs skip the per-row Python uuid4 call
+    id: Mapped[str] = mapped_column(UUIDStr, primary_key=True, default=uuid4_str)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
+    )
+
+
+# Shared trigger function that stamps updated_at server-side; one plpgsql
+# call per UPDATE replaces SQLAlchemy shipping a fresh timestamp parameter
+# with every statement (PostgreSQL only - SQLite test DBs skip it).
+_SET_UPDATED_AT_FUNCTION = DDL(
+    """
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at = CURRENT_TIMESTAMP;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+event.listen(
+    Base.metadata,
+    "before_create",
+    _SET_UPDATED_AT_FUNCTION.execute_if(dialect="postgresql"),
+)
+
+
+def register_updated_at_trigger(table_name: str) -> None:
+    """Maintain ``updated_at`` on a table with a BEFORE UPDATE trigger."""
+    trigger = DDL(
+        f"CREATE TRIGGER trg_{table_name}_updated_at "
+        f"BEFORE UPDATE ON {table_name} "
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    )
+    event.listen(
+        Base.metadata, "after_create", trigger.execute_if(dialect="postgresql")
+    )
+    # gen_random_uuid() cannot live in the column definition - SQLite
+    # rejects function defaults in CREATE TABLE - so PostgreSQL attaches
+    # it after the fact and server-generates ids from then on
+    uuid_default = DDL(
+        f"ALTER TABLE {table_name} "
+        "ALTER COLUMN id SET DEFAULT gen_random_uuid()"
+    )
+    event.listen(
+        Base.metadata, "after_create", uuid_default.execute_if(dialect="postgresql")
+    )
+
+
 class DatabaseManager:
     """Manages database connections and sessions."""
 
@@ -30,22 +195,30 @@ class DatabaseManager:
         self.async_session_factory = None
         self.redis_client = None
         self._database_url = get_database_url()
+        # Precompute the asyncpg form once so reconnects skip the scan
+        self._async_url = self._database_url.replace(
+            "postgresql://", "postgresql+asyncpg://", 1
+        )
+        self._db_last_ok = 0.0
+        self._redis_last_ok = 0.0
 
     async def connect(self):
         """Initialize database and Redis connections."""
         try:
-            # Create async database engine
-            # Convert postgresql:// to postgresql+asyncpg:// for async support
-            async_url = self._database_url.replace(
-                "postgresql://", "postgresql+asyncpg://"
-            )
-
+            # Create async database engine using the asyncpg URL computed
+            # in __init__
             self.engine = create_async_engine(
-                async_url,
+                self._async_url,
                 pool_size=settings.database_pool_size,
                 max_overflow=settings.database_max_overflow,
                 pool_pre_ping=settings.database_pool_pre_ping,
                 echo=settings.debug,
+                # Batch executemany INSERTs into multi-row VALUES pages so
+                # bulk ingestion pays one round-trip per page, not per row
+                insertmanyvalues_page_size=10_000,
+                # Room for every hot statement shape; the default 500 can
+                # evict list/count statements under mixed endpoint load
+                query_cache_size=5_000,
             )
 
             # Create session factory
@@ -57,23 +230,35 @@ class DatabaseManager:
 
             # Test database connection
             async with self.engine.begin() as conn:
-                await conn.execute("SELECT 1")
+                await conn.execute(text("SELECT 1"))
 
             logger.info("Database connection established successfully")
 
             # Initialize Redis connection
-            self.redis_client = redis.from_url(
+            # Binary mode: decode_responses=True would UTF-8 decode every
+            # byte of every reply; callers that need str decode per key
+            # via redis_get_str instead. An explicit pool makes connection
+            # reuse visible rather than relying on from_url defaults.
+            redis_pool = redis.ConnectionPool.from_url(
                 settings.redis_url,
                 max_connections=settings.redis_max_connections,
-                decode_responses=True,
+                decode_responses=False,
             )
+            self.redis_client = redis.Redis(connection_pool=redis_pool)
 
-            # Test Redis connection
+            # Test Redis connection, then warm part of the pool so the
+            # first real requests do not pay TCP+AUTH setup latency
             await self.redis_client.ping()
+            await asyncio.gather(
+                *(
+                    self.redis_client.ping()
+                    for _ in range(settings.redis_max_connections // 2)
+                )
+            )
             logger.info("Redis connection established successfully")
 
         except Exception as e:
-            logger.error(f"Failed to connect to database or Redis: {e}")
+            logger.error("Failed to connect to database or Redis: %s", e)
             raise
 
     async def disconnect(self):
@@ -102,6 +287,18 @@ class DatabaseManager:
             finally:
                 await session.close()
 
+    @asynccontextmanager
+    async def get_readonly_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get async session for read-only work; skips the COMMIT roundtrip."""
+        if not self.async_session_factory:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        async with self.async_session_factory() as session:
+            try:
+                yield session
+            finally:
+                await session.close()
+
     async def get_redis(self) -> redis.Redis:
         """Get Redis client."""
         if not self.redis_client:
@@ -119,11 +316,41 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_db_session_ro() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get a read-only database session in FastAPI routes."""
+    async with database.get_readonly_session() as session:
+        yield session
+
+
 async def get_redis_client() -> redis.Redis:
     """Dependency to get Redis client in FastAPI routes."""
     return await database.get_redis()
 
 
+async def redis_get_str(client: redis.Redis, key: str) -> Optional[str]:
+    """Get a key from Redis decoded to str, or None if missing."""
+    value = await client.get(key)
+    return value.decode() if value is not None else None
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model,
+    rows: Sequence[Dict[str, Any]],
+    page_size: int = 10_000,
+) -> None:
+    """Insert plain-dict rows for a model via the insertmanyvalues path.
+
+    ``session.add_all()`` builds a tracked ORM instance and emits one
+    INSERT round-trip per row; executing ``insert(model)`` with a list of
+    dicts lets SQLAlchemy batch ``page_size`` rows into each multi-row
+    VALUES statement - the right shape for harvester-driven ingestion of
+    drugs, patents, analytics and new-entry records.
+    """
+    for start in range(0, len(rows), page_size):
+        await session.execute(insert(model), rows[start : start + page_size])
+
+
 # Health check functions
 async def check_database_health() -> bool:
     """Check if database is accessible."""
@@ -131,11 +358,19 @@ async def check_database_health() -> bool:
         if not database.engine:
             return False
 
-        async with database.engine.begin() as conn:
-            await conn.execute("SELECT 1")
+        # Amortize the wire roundtrip across frequent probe calls
+        if time.monotonic() - database._db_last_ok < HEALTH_CHECK_TTL_SECONDS:
+            return True
+
+        # connect() skips the BEGIN/COMMIT frames a transaction would send,
+        # and exec_driver_sql bypasses the statement compiler for this
+        # constant probe query.
+        async with database.engine.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
+        database._db_last_ok = time.monotonic()
         return True
     except Exception as e:
-        logger.error(f"Database health check failed: {e}")
+        logger.error("Database health check failed: %s", e)
         return False
 
 
@@ -145,8 +380,13 @@ async def check_redis_health() -> bool:
         if not database.redis_client:
             return False
 
+        # Amortize the wire roundtrip across frequent probe calls
+        if time.monotonic() - database._redis_last_ok < HEALTH_CHECK_TTL_SECONDS:
+            return True
+
         await database.redis_client.ping()
+        database._redis_last_ok = time.monotonic()
         return True
     except Exception as e:
-        logger.error(f"Redis health check failed: {e}")
+        logger.error("Redis health check failed: %s", e)
         return False
@@ -2,12 +2,11 @@
 Custom exceptions and exception handlers for the API.
 """
 
-import traceback
 from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 import logging
@@ -117,10 +116,12 @@ class ExternalServiceError(APIException):
         )
 
 
-async def api_exception_handler(request: Request, exc: APIException) -> JSONResponse:
+async def api_exception_handler(request: Request, exc: APIException) -> ORJSONResponse:
     """Handle custom API exceptions."""
     logger.error(
-        f"API Exception: {exc.error_code} - {exc.message}",
+        "API Exception: %s - %s",
+        exc.error_code,
+        exc.message,
         extra={
             "error_code": exc.error_code,
             "status_code": exc.status_code,
@@ -130,7 +131,7 @@ async def api_exception_handler(request: Request, exc: APIException) -> JSONResp
         },
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.error_code,
@@ -142,10 +143,11 @@ async def api_exception_handler(request: Request, exc: APIException) -> JSONResp
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle request validation errors."""
     logger.warning(
-        f"Validation error: {exc}",
+        "Validation error: %s",
+        exc,
         extra={
             "errors": exc.errors(),
             "path": request.url.path,
@@ -153,7 +155,7 @@ async def validation_exception_handler(
         },
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "VALIDATION_ERROR",
@@ -167,10 +169,12 @@ async def validation_exception_handler(
 
 async def http_exception_handler(
     request: Request, exc: StarletteHTTPException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle HTTP exceptions."""
     logger.warning(
-        f"HTTP Exception: {exc.status_code} - {exc.detail}",
+        "HTTP Exception: %s - %s",
+        exc.status_code,
+        exc.detail,
         extra={
             "status_code": exc.status_code,
             "path": request.url.path,
@@ -178,7 +182,7 @@ async def http_exception_handler(
         },
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "HTTP_ERROR",
@@ -188,19 +192,24 @@ async def http_exception_handler(
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(
+    request: Request, exc: Exception
+) -> ORJSONResponse:
     """Handle general exceptions."""
+    # exc_info defers traceback formatting to the logging handler, so the
+    # frame walk and string build only happen if a handler emits the record
     logger.error(
-        f"Unhandled exception: {exc}",
+        "Unhandled exception: %s",
+        exc,
         extra={
             "exception_type": type(exc).__name__,
-            "traceback": traceback.format_exc(),
             "path": request.url.path,
             "method": request.method,
         },
+        exc_info=exc,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "INTERNAL_ERROR",
@@ -212,7 +221,13 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
 
 def register_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers with the FastAPI app."""
-    app.add_exception_handler(APIException, api_exception_handler)
-    app.add_exception_handler(RequestValidationError, validation_exception_handler)
-    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
-    app.add_exception_handler(Exception, general_exception_handler)
+    # One dict merge instead of four add_exception_handler calls, each of
+    # which updates the app's handler table separately
+    app.exception_handlers.update(
+        {
+            APIException: api_exception_handler,
+            RequestValidationError: validation_exception_handler,
+            StarletteHTTPException: http_exception_handler,
+            Exception: general_exception_handler,
+        }
+    )
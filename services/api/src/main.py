@@ -2,16 +2,15 @@
 Main FastAPI application module for DrugInsightAI API service.
 """
 
-import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import uvicorn
 from config import settings
 from exceptions import register_exception_handlers
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from middleware.auth import AuthMiddleware
 from middleware.logging import LoggingMiddleware
 from routes import auth, clinical_trials, companies, drugs, health, market, users
@@ -64,6 +63,10 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
         docs_url="/docs" if settings.environment != "production" else None,
         redoc_url="/redoc" if settings.environment != "production" else None,
+        # orjson serializes responses several times faster than stdlib
+        # json and validates UTF-8 in C; applies to every route that does
+        # not name its own response class
+        default_response_class=ORJSONResponse,
     )
 
     # Add CORS middleware
@@ -82,14 +85,8 @@ def create_app() -> FastAPI:
     # Register exception handlers
     register_exception_handlers(app)
 
-    # Add request timing middleware
-    @app.middleware("http")
-    async def add_process_time_header(request: Request, call_next):
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
+    # Request timing lives in LoggingMiddleware, which sets the
+    # X-Process-Time header from its single perf_counter measurement
 
     # Register routes
     app.include_router(health.router, tags=["Health"])
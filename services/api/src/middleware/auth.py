@@ -2,25 +2,93 @@
 Authentication middleware supporting both AWS Cognito and local authentication.
 """
 
-from datetime import datetime, timedelta
+import hashlib
+import hmac
+import time
+from datetime import timedelta
 from typing import Any, Dict, Optional, Tuple
 
-import boto3
 import jwt
+import orjson
 from config import settings
+from jwt import PyJWKClient
 from exceptions import AuthenticationError, AuthorizationError
 from fastapi import HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt as jose_jwt, JWTError
 from passlib.context import CryptContext
+from sqlalchemy import text
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
 import logging
-from database import get_db_session
+from database import database, get_db_session
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded bodies for the two unauthenticated failure responses, so
+# rejecting a request never re-encodes the same JSON string to bytes.
+_NO_TOKEN_BODY = (
+    b'{"error": "AUTHENTICATION_ERROR", '
+    b'"message": "No authentication token provided"}'
+)
+_INVALID_TOKEN_BODY = (
+    b'{"error": "AUTHENTICATION_ERROR", "message": "Invalid or expired token"}'
+)
+
+# In-process cache of successfully verified token payloads keyed by the
+# SHA-256 digest of the token. A hit skips the HMAC + base64 + JSON decode
+# entirely for repeat requests from the same client; the 32-byte digest
+# keys bound the cache at ~10k x ~160 B instead of retaining full JWT
+# strings (and keep raw bearer tokens out of process memory). Entries are
+# trusted for at most _TOKEN_CACHE_TTL seconds and never beyond the
+# token's own exp claim.
+_TOKEN_CACHE: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX = 10_000
+
+# How long a resolved API-key user may be served from Redis before the
+# database is consulted again; bounds revocation latency.
+_API_KEY_USER_TTL = 30
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Digest a token into its fixed-width cache key."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def hash_api_key(api_key: str) -> str:
+    """Hash an API key with HMAC-SHA256 under the server-side pepper.
+
+    Unlike bcrypt, the digest is deterministic, so it can be used directly
+    as an indexed lookup key; the pepper keeps raw digests useless to an
+    attacker who only obtains the database.
+    """
+    return hmac.new(
+        settings.api_key_pepper.encode(), api_key.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def _token_cache_get(key: bytes) -> Optional[Dict[str, Any]]:
+    """Return the cached payload for a token digest if still valid."""
+    cached = _TOKEN_CACHE.get(key)
+    if cached is None:
+        return None
+    valid_until, payload = cached
+    if time.time() < valid_until:
+        return payload
+    del _TOKEN_CACHE[key]
+    return None
+
+
+def _token_cache_put(key: bytes, payload: Dict[str, Any]) -> None:
+    """Cache a verified payload, bounded by TTL and the token's exp claim."""
+    if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+        _TOKEN_CACHE.clear()
+    now = time.time()
+    valid_until = min(now + _TOKEN_CACHE_TTL, float(payload.get("exp", 0)) or now)
+    _TOKEN_CACHE[key] = (valid_until, payload)
+
 
 class AuthenticationService:
     """Service for handling authentication operations."""
@@ -30,11 +98,39 @@ class AuthenticationService:
             schemes=settings.password_hash_schemes,
             deprecated=settings.password_hash_deprecated,
         )
-        self.cognito_client = None
+        # Bind signing parameters once; every encode/decode reuses the
+        # same objects instead of rebuilding a list per call
+        self._secret_key = settings.secret_key
+        self._algorithm = settings.algorithm
+        self._jwt_algorithms = [settings.algorithm]
+        self._access_ttl = settings.access_token_expire_minutes * 60
+        self._refresh_ttl = settings.refresh_token_expire_days * 86400
+        self._cognito_client = None
+        self._jwks_client = None
         if settings.enable_aws_auth:
-            self.cognito_client = boto3.client(
+            # One JWKS client per process: it fetches and caches the pool's
+            # signing keys with a TTL instead of per-request key handling
+            self._jwks_client = PyJWKClient(
+                f"https://cognito-idp.{settings.aws_region}.amazonaws.com/"
+                f"{settings.aws_cognito_user_pool_id}/.well-known/jwks.json",
+                cache_keys=True,
+                lifespan=3600,
+            )
+
+    @property
+    def cognito_client(self):
+        """Cognito client, imported and constructed on first use.
+
+        The boto3/botocore import alone costs ~150 ms and loads a large
+        service model, so deployments without AWS auth never pay it.
+        """
+        if self._cognito_client is None and settings.enable_aws_auth:
+            import boto3
+
+            self._cognito_client = boto3.client(
                 "cognito-idp", region_name=settings.aws_region
             )
+        return self._cognito_client
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash."""
@@ -48,60 +144,75 @@ class AuthenticationService:
         self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None
     ) -> str:
         """Create a JWT access token."""
-        to_encode = data.copy()
+        # exp is a UNIX timestamp inside the JWT anyway, so integer
+        # arithmetic avoids the datetime allocations per issued token
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = int(time.time()) + int(expires_delta.total_seconds())
         else:
-            expire = datetime.utcnow() + timedelta(
-                minutes=settings.access_token_expire_minutes
-            )
+            expire = int(time.time()) + self._access_ttl
 
-        to_encode.update({"exp": expire, "type": "access"})
+        # Single C-level dict merge instead of copy + update
+        to_encode = {**data, "exp": expire, "type": "access"}
         encoded_jwt = jose_jwt.encode(
-            to_encode, settings.secret_key, algorithm=settings.algorithm
+            to_encode, self._secret_key, algorithm=self._algorithm
         )
         return encoded_jwt
 
     def create_refresh_token(self, data: Dict[str, Any]) -> str:
         """Create a JWT refresh token."""
-        to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
-        to_encode.update({"exp": expire, "type": "refresh"})
+        expire = int(time.time()) + self._refresh_ttl
+        to_encode = {**data, "exp": expire, "type": "refresh"}
         encoded_jwt = jose_jwt.encode(
-            to_encode, settings.secret_key, algorithm=settings.algorithm
+            to_encode, self._secret_key, algorithm=self._algorithm
         )
         return encoded_jwt
 
     async def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify and decode a JWT token."""
+        if settings.token_validation_cache:
+            cache_key = _token_cache_key(token)
+            cached = _token_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             payload = jose_jwt.decode(
-                token, settings.secret_key, algorithms=[settings.algorithm]
+                token, self._secret_key, algorithms=self._jwt_algorithms
             )
+            if settings.token_validation_cache:
+                _token_cache_put(cache_key, payload)
             return payload
         except JWTError as e:
-            logger.warning(f"JWT verification failed: {e}")
+            logger.warning("JWT verification failed: %s", e)
             return None
 
     async def verify_cognito_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify an AWS Cognito JWT token."""
-        if not settings.enable_aws_auth or not self.cognito_client:
+        if not settings.enable_aws_auth or not self._jwks_client:
             return None
 
-        try:
-            # Get Cognito public keys
-            jwks_url = f"https://cognito-idp.{settings.aws_region}.amazonaws.com/{settings.aws_cognito_user_pool_id}/.well-known/jwks.json"
+        if settings.token_validation_cache:
+            cache_key = _token_cache_key(token)
+            cached = _token_cache_get(cache_key)
+            if cached is not None:
+                return cached
 
-            # This is a simplified version - in production, you'd want to cache the JWKS
-            # and implement proper key rotation handling
+        try:
+            # The JWKS client resolves the signing key from its cached key
+            # set, so the RS256 signature is actually verified without a
+            # network fetch per request
+            signing_key = self._jwks_client.get_signing_key_from_jwt(token)
             payload = jwt.decode(
                 token,
-                options={"verify_signature": False},  # Simplified for demo
+                signing_key.key,
+                algorithms=["RS256"],
                 audience=settings.aws_cognito_client_id,
             )
+            if settings.token_validation_cache:
+                _token_cache_put(cache_key, payload)
             return payload
         except Exception as e:
-            logger.warning(f"Cognito token verification failed: {e}")
+            logger.warning("Cognito token verification failed: %s", e)
             return None
 
     async def authenticate_user(
@@ -175,19 +286,40 @@ class AuthenticationService:
                     },
                 }
         except Exception as e:
-            logger.warning(f"Cognito authentication failed: {e}")
+            logger.warning("Cognito authentication failed: %s", e)
             return None
 
 
+# Global authentication service instance
+auth_service = AuthenticationService()
+
+
 class AuthMiddleware(BaseHTTPMiddleware):
     """Authentication middleware for the API."""
 
-    def __init__(self, app, auth_service: Optional[AuthenticationService] = None):
+    def __init__(self, app, service: Optional[AuthenticationService] = None):
         super().__init__(app)
-        self.auth_service = auth_service or AuthenticationService()
+        # Default to the module-level singleton so every middleware
+        # instantiation shares one CryptContext and one Cognito client
+        self.auth_service = service or auth_service
+
+        # Prebuilt failure responses returned as-is on every rejection;
+        # dispatch only reads them, so sharing one instance is safe and
+        # avoids two Response allocations per unauthenticated request
+        self._no_token_response = Response(
+            content=_NO_TOKEN_BODY,
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            media_type="application/json",
+        )
+        self._invalid_token_response = Response(
+            content=_INVALID_TOKEN_BODY,
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            media_type="application/json",
+        )
 
-        # Routes that don't require authentication
-        self.public_routes = {
+        # Routes that don't require authentication; a tuple lets
+        # str.startswith run the prefix loop in C
+        self.public_routes = (
             "/health",
             "/metrics",
             "/auth/login",
@@ -195,34 +327,26 @@ class AuthMiddleware(BaseHTTPMiddleware):
             "/docs",
             "/redoc",
             "/openapi.json",
-        }
+        )
 
     async def dispatch(self, request: Request, call_next) -> Response:
         """Process authentication for each request."""
         path = request.url.path
 
         # Skip authentication for public routes
-        if any(path.startswith(route) for route in self.public_routes):
+        if path.startswith(self.public_routes):
             response = await call_next(request)
             return response
 
         # Extract token from request
         token = await self._extract_token(request)
         if not token:
-            return Response(
-                content='{"error": "AUTHENTICATION_ERROR", "message": "No authentication token provided"}',
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                media_type="application/json",
-            )
+            return self._no_token_response
 
         # Verify token
         user_data = await self._verify_token(token)
         if not user_data:
-            return Response(
-                content='{"error": "AUTHENTICATION_ERROR", "message": "Invalid or expired token"}',
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                media_type="application/json",
-            )
+            return self._invalid_token_response
 
         # Add user data to request state
         request.state.current_user = user_data
@@ -235,7 +359,8 @@ class AuthMiddleware(BaseHTTPMiddleware):
         # Try Bearer token first
         authorization = request.headers.get("Authorization")
         if authorization and authorization.startswith("Bearer "):
-            return authorization.split(" ")[1]
+            # Slice past the confirmed prefix; no split-list allocation
+            return authorization[7:]
 
         # Try API key header
         api_key = request.headers.get("X-API-Key")
@@ -257,60 +382,69 @@ class AuthMiddleware(BaseHTTPMiddleware):
             if user_data:
                 return user_data
 
-        # Try API key verification
-        if await self._verify_api_key(token):
-            return await self._get_api_key_user(token)
-
-        return None
-
-    async def _verify_api_key(self, api_key: str) -> bool:
-        """Verify API key against stored hashes."""
-        async with get_db_session() as db:
-            # Get all active API key hashes to verify against
-            result = await db.execute(
-                "SELECT key_hash FROM api_keys WHERE is_active = true AND (expires_at IS NULL OR expires_at > NOW())"
-            )
-            stored_hashes = result.fetchall()
-
-            # Use constant-time comparison to prevent timing attacks
-            for row in stored_hashes:
-                if self.auth_service.verify_password(api_key, row.key_hash):
-                    return True
-            return False
+        # Try API key verification; the lookup returns user data iff the
+        # key is valid, so no separate existence check is needed
+        return await self._get_api_key_user(token)
 
     async def _get_api_key_user(self, api_key: str) -> Optional[Dict[str, Any]]:
-        """Get user data for API key using secure verification."""
+        """Get user data for API key using secure verification.
+
+        Successful lookups are cached in Redis for a short TTL keyed by
+        the key's HMAC digest, so steady API-key traffic pays one Redis
+        GET per request instead of a users/api_keys join. Misses and
+        invalid keys are never cached, and a revoked key falls out of the
+        cache within _API_KEY_USER_TTL seconds.
+        """
+        key_hash = hash_api_key(api_key)
+        cache_key = "auth:apikey:" + key_hash
+        client = database.redis_client
+        if client is not None:
+            try:
+                cached = await client.get(cache_key)
+                if cached is not None:
+                    return orjson.loads(cached)
+            except Exception:
+                # Redis being down must not break authentication
+                pass
+
         async with get_db_session() as db:
-            # Get all active API keys with user data
             result = await db.execute(
-                """
-                SELECT u.id, u.email, u.first_name, u.last_name, u.role, u.organization, ak.key_hash
-                FROM users u
-                JOIN api_keys ak ON u.id = ak.user_id
-                WHERE ak.is_active = true AND (ak.expires_at IS NULL OR ak.expires_at > NOW())
-                """
+                text(
+                    """
+                    SELECT u.id, u.email, u.first_name, u.last_name,
+                           u.role, u.organization
+                    FROM users u
+                    JOIN api_keys ak ON u.id = ak.user_id
+                    WHERE ak.key_hash = :key_hash
+                    AND ak.is_active = true
+                    AND (ak.expires_at IS NULL OR ak.expires_at > NOW())
+                    """
+                ),
+                {"key_hash": key_hash},
             )
-            api_key_data = result.fetchall()
-
-            # Verify API key against each stored hash using constant-time comparison
-            for row in api_key_data:
-                if self.auth_service.verify_password(api_key, row.key_hash):
-                    return {
-                        "user_id": str(row.id),
-                        "email": row.email,
-                        "first_name": row.first_name,
-                        "last_name": row.last_name,
-                        "role": row.role,
-                        "organization": row.organization,
-                        "auth_type": "api_key",
-                    }
+            row = result.fetchone()
+
+            if row:
+                user_data = {
+                    "user_id": str(row.id),
+                    "email": row.email,
+                    "first_name": row.first_name,
+                    "last_name": row.last_name,
+                    "role": row.role,
+                    "organization": row.organization,
+                    "auth_type": "api_key",
+                }
+                if client is not None:
+                    try:
+                        await client.setex(
+                            cache_key, _API_KEY_USER_TTL, orjson.dumps(user_data)
+                        )
+                    except Exception:
+                        pass
+                return user_data
         return None
 
 
-# Global authentication service instance
-auth_service = AuthenticationService()
-
-
 def get_current_user(request: Request) -> Dict[str, Any]:
     """Dependency to get current authenticated user."""
     if not hasattr(request.state, "current_user"):
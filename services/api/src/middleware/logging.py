@@ -6,14 +6,11 @@ import time
 import uuid
 from typing import Callable
 
-import structlog
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
 import logging
 
-logger = structlog.get_logger(__name__)
-
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for logging HTTP requests and responses."""
@@ -24,58 +21,60 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Log request and response information."""
-        # Generate request ID for tracing
-        request_id = str(uuid.uuid4())
+        # Generate request ID for tracing; .hex skips the dashed formatter
+        request_id = uuid.uuid4().hex
         request.state.request_id = request_id
 
         # Extract client information
         client_ip = request.client.host if request.client else "unknown"
         user_agent = request.headers.get("user-agent", "unknown")
 
-        # Log request start
-        start_time = time.time()
-        self.logger.info(
-            "Request started",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "url": str(request.url),
-                "path": request.url.path,
-                "query_params": dict(request.query_params),
-                "client_ip": client_ip,
-                "user_agent": user_agent,
-                "headers": dict(request.headers),
-            },
-        )
+        # Log request start; full headers only at DEBUG since materializing
+        # the multi-dict allocates per request
+        start_time = time.perf_counter()
+        request_extra = {
+            "request_id": request_id,
+            "method": request.method,
+            "path": request.url.path,
+            "query_params": dict(request.query_params),
+            "client_ip": client_ip,
+            "user_agent": user_agent,
+        }
+        if self.logger.isEnabledFor(logging.DEBUG):
+            request_extra["headers"] = dict(request.headers)
+        self.logger.info("Request started", extra=request_extra)
 
         # Process request
         try:
             response = await call_next(request)
 
-            # Calculate processing time
-            process_time = time.time() - start_time
+            # Calculate processing time; this is the single timing
+            # measurement for the request, exposed on request.state and
+            # the X-Process-Time header
+            process_time = time.perf_counter() - start_time
+            request.state.process_time = process_time
 
-            # Log successful response
-            self.logger.info(
-                "Request completed",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "process_time": process_time,
-                    "response_headers": dict(response.headers),
-                },
-            )
-
-            # Add request ID to response headers
+            # Log successful response; response headers only at DEBUG
+            response_extra = {
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": response.status_code,
+                "process_time": process_time,
+            }
+            if self.logger.isEnabledFor(logging.DEBUG):
+                response_extra["response_headers"] = dict(response.headers)
+            self.logger.info("Request completed", extra=response_extra)
+
+            # Add request ID and timing to response headers
             response.headers["X-Request-ID"] = request_id
+            response.headers["X-Process-Time"] = f"{process_time:.6f}"
 
             return response
 
         except Exception as e:
             # Calculate processing time for failed requests
-            process_time = time.time() - start_time
+            process_time = time.perf_counter() - start_time
 
             # Log error
             self.logger.error(
@@ -1 +1,23 @@
-"""Database models for the DrugInsightAI API."""
+"""Database models for the DrugInsightAI API.
+
+Importing any model module must register every table on ``Base.metadata``:
+cross-module foreign keys (``drugs.company_id`` -> ``companies.id``) only
+resolve when both tables are present, so the package imports all model
+modules up front.
+"""
+
+from models.clinical_trials import (  # noqa: F401
+    ClinicalTrial,
+    TrialInvestigator,
+    TrialResult,
+)
+from models.companies import Company, CompanyPartnership  # noqa: F401
+from models.drugs import (  # noqa: F401
+    AdverseEvent,
+    Drug,
+    DrugAnalytics,
+    DrugPatent,
+    DrugRegulatoryStatus,
+    NewDrugEntry,
+)
+from models.users import ApiKey, RefreshToken, User, UserSession  # noqa: F401
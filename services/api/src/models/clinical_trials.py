@@ -3,16 +3,28 @@ Clinical trial-related database models.
 """
 
 import enum
-import uuid
-from datetime import date, datetime
+from datetime import date
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Date, DateTime, Enum, Index, Integer, JSON, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy import (
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
 
-from database import Base
+from database import (
+    Base,
+    EnumAsInt,
+    JSONDoc,
+    TimestampedUUIDMixin,
+    UUIDStr,
+    portable_array,
+    register_updated_at_trigger,
+)
 
 
 class TrialPhaseEnum(enum.Enum):
@@ -37,32 +49,29 @@ class TrialStatusEnum(enum.Enum):
     SUSPENDED = "suspended"
 
 
-class ClinicalTrial(Base):
+class ClinicalTrial(TimestampedUUIDMixin, Base):
     """Clinical trial information model."""
 
     __tablename__ = "clinical_trials"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
-    )
     nct_id: Mapped[Optional[str]] = mapped_column(
-        String(50), nullable=True, unique=True, index=True
+        String(50), nullable=True, unique=True
     )  # NCT number
     title: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Trial classification
     phase: Mapped[TrialPhaseEnum] = mapped_column(
-        Enum(TrialPhaseEnum), nullable=False, index=True
+        EnumAsInt(TrialPhaseEnum), nullable=False
     )
     status: Mapped[TrialStatusEnum] = mapped_column(
-        Enum(TrialStatusEnum), nullable=False, index=True
+        EnumAsInt(TrialStatusEnum), nullable=False
     )
 
     # Associated entities
-    drug_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        UUID(as_uuid=True), nullable=True, index=True
+    drug_id: Mapped[Optional[str]] = mapped_column(
+        UUIDStr, ForeignKey("drugs.id"), nullable=True
     )
-    sponsor: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    sponsor: Mapped[str] = mapped_column(String(200), nullable=False)
 
     # Study details
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -77,32 +86,32 @@ class ClinicalTrial(Base):
     enrollment_actual: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Timeline
-    start_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True, index=True)
+    start_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     completion_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     primary_completion_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
 
     # Geographic information
     locations: Mapped[Optional[List[str]]] = mapped_column(
-        ARRAY(String(200)), nullable=True
+        portable_array(String(200)), nullable=True
     )
     countries: Mapped[Optional[List[str]]] = mapped_column(
-        ARRAY(String(100)), nullable=True
+        portable_array(String(100)), nullable=True
     )
 
     # Study objectives
     primary_endpoints: Mapped[Optional[List[str]]] = mapped_column(
-        ARRAY(Text), nullable=True
+        portable_array(Text), nullable=True
     )
     secondary_endpoints: Mapped[Optional[List[str]]] = mapped_column(
-        ARRAY(Text), nullable=True
+        portable_array(Text), nullable=True
     )
 
     # Eligibility criteria
     inclusion_criteria: Mapped[Optional[List[str]]] = mapped_column(
-        ARRAY(Text), nullable=True
+        portable_array(Text), nullable=True
     )
     exclusion_criteria: Mapped[Optional[List[str]]] = mapped_column(
-        ARRAY(Text), nullable=True
+        portable_array(Text), nullable=True
     )
     min_age: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     max_age: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
@@ -110,42 +119,40 @@ class ClinicalTrial(Base):
 
     # Additional data as JSON for flexibility
     additional_info: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON, nullable=True
+        JSONDoc, nullable=True
     )
 
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
-    )
-
-    # Relationships
-    drug = relationship("Drug", back_populates="clinical_trials")
+    # Relationships; lazy="raise" forbids implicit per-row loads - query
+    # sites must opt in with selectinload(), which batches the child fetch
+    # into one WHERE trial_id IN (...) instead of N+1 selects
+    drug = relationship("Drug", back_populates="clinical_trials", lazy="raise")
     investigators = relationship(
-        "TrialInvestigator", back_populates="trial", cascade="all, delete-orphan"
+        "TrialInvestigator",
+        back_populates="trial",
+        cascade="all, delete-orphan",
+        lazy="raise",
     )
     results = relationship(
-        "TrialResult", back_populates="trial", cascade="all, delete-orphan"
+        "TrialResult", back_populates="trial", cascade="all, delete-orphan", lazy="raise"
     )
 
     def __repr__(self):
+        # Read straight from __dict__: repr on a detached or partially
+        # loaded row must never trigger instrumentation or a lazy load
+        d = self.__dict__
         return (
-            f"<ClinicalTrial(id={self.id}, nct_id={self.nct_id}, phase={self.phase})>"
+            f"<ClinicalTrial(id={d.get('id')!r}, nct_id={d.get('nct_id')!r}, "
+            f"phase={d.get('phase')!r})>"
         )
 
 
-class TrialInvestigator(Base):
+class TrialInvestigator(TimestampedUUIDMixin, Base):
     """Trial investigator information model."""
 
     __tablename__ = "trial_investigators"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
-    )
-    trial_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), nullable=False, index=True
+    trial_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("clinical_trials.id"), nullable=False, index=True
     )
 
     # Investigator details
@@ -165,31 +172,24 @@ class TrialInvestigator(Base):
     state: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     country: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
-    )
-
     # Relationship
     trial = relationship("ClinicalTrial", back_populates="investigators")
 
     def __repr__(self):
-        return f"<TrialInvestigator(trial_id={self.trial_id}, name={self.name})>"
+        d = self.__dict__
+        return (
+            f"<TrialInvestigator(trial_id={d.get('trial_id')!r}, "
+            f"name={d.get('name')!r})>"
+        )
 
 
-class TrialResult(Base):
+class TrialResult(TimestampedUUIDMixin, Base):
     """Trial results and outcomes model."""
 
     __tablename__ = "trial_results"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
-    )
-    trial_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), nullable=False, index=True
+    trial_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("clinical_trials.id"), nullable=False, index=True
     )
 
     # Results overview
@@ -210,41 +210,66 @@ class TrialResult(Base):
 
     # Efficacy data
     efficacy_endpoints: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON, nullable=True
+        JSONDoc, nullable=True
     )
     statistical_analysis: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON, nullable=True
+        JSONDoc, nullable=True
     )
 
     # Publications
     publications: Mapped[Optional[List[str]]] = mapped_column(
-        ARRAY(Text), nullable=True
+        portable_array(Text), nullable=True
     )
 
     # Complete results data as JSON for flexibility
     full_results_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON, nullable=True
-    )
-
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        JSONDoc, nullable=True
     )
 
     # Relationship
     trial = relationship("ClinicalTrial", back_populates="results")
 
     def __repr__(self):
-        return f"<TrialResult(trial_id={self.trial_id}, results_posted={self.results_posted})>"
+        d = self.__dict__
+        return (
+            f"<TrialResult(trial_id={d.get('trial_id')!r}, "
+            f"results_posted={d.get('results_posted')!r})>"
+        )
 
 
 # Create indexes for performance
 Index("idx_clinical_trials_nct_id", ClinicalTrial.nct_id)
 Index("idx_clinical_trials_drug_id", ClinicalTrial.drug_id)
 Index("idx_clinical_trials_phase", ClinicalTrial.phase)
-Index("idx_clinical_trials_status", ClinicalTrial.status)
 Index("idx_clinical_trials_sponsor", ClinicalTrial.sponsor)
 Index("idx_clinical_trials_start_date", ClinicalTrial.start_date)
+
+# Listing endpoints filter on the small recruiting/active slice and sort by
+# start date; a partial covering index keeps completed/terminated rows out of
+# the leaves and answers the listing query with an index-only scan
+Index(
+    "idx_trials_active_by_date",
+    ClinicalTrial.status,
+    ClinicalTrial.start_date.desc(),
+    postgresql_where=ClinicalTrial.status.in_(
+        [TrialStatusEnum.RECRUITING, TrialStatusEnum.ACTIVE]
+    ),
+    postgresql_include=["nct_id", "phase", "sponsor"],
+)
+
+# Containment lookups (countries @> ARRAY['US']) need GIN posting lists
+Index("idx_trials_countries_gin", ClinicalTrial.countries, postgresql_using="gin")
+
+# jsonb_path_ops GIN serves @> path queries over efficacy results with
+# smaller posting lists than the default jsonb_ops opclass
+Index(
+    "idx_trial_results_efficacy_gin",
+    TrialResult.efficacy_endpoints,
+    postgresql_using="gin",
+    postgresql_ops={"efficacy_endpoints": "jsonb_path_ops"},
+)
+
+# updated_at is maintained by a single server-side BEFORE UPDATE trigger
+register_updated_at_trigger("clinical_trials")
+register_updated_at_trigger("trial_investigators")
+register_updated_at_trigger("trial_results")
@@ -2,30 +2,58 @@
 Company-related database models.
 """
 
-import uuid
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import Date, DateTime, Index, Integer, Numeric, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    TypeDecorator,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
 
-from database import Base
+from database import (
+    Base,
+    TimestampedUUIDMixin,
+    UUIDStr,
+    portable_array,
+    register_updated_at_trigger,
+)
 
 
-class Company(Base):
+class MoneyCents(TypeDecorator):
+    """Store a currency amount as integer cents.
+
+    An int8 column is half the width of variable-length numeric and lets
+    aggregates run on hardware integers instead of software decimal
+    arithmetic; cent precision is all the financial columns need. Python
+    code keeps seeing Decimal values.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else int((value * 100).to_integral_value())
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else Decimal(value) / 100
+
+
+class Company(TimestampedUUIDMixin, Base):
     """Pharmaceutical company model."""
 
     __tablename__ = "companies"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
-    )
-    name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
-    ticker: Mapped[Optional[str]] = mapped_column(String(10), nullable=True, index=True)
-    country: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
+    ticker: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    country: Mapped[str] = mapped_column(String(100), nullable=False)
     headquarters: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     website: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
@@ -36,68 +64,59 @@ class Company(Base):
     employees: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Financial information
-    market_cap: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(15, 2), nullable=True, index=True
-    )
-    revenue: Mapped[Optional[Decimal]] = mapped_column(Numeric(15, 2), nullable=True)
-    rd_spending: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(15, 2), nullable=True
-    )
+    market_cap: Mapped[Optional[Decimal]] = mapped_column(MoneyCents, nullable=True)
+    revenue: Mapped[Optional[Decimal]] = mapped_column(MoneyCents, nullable=True)
+    rd_spending: Mapped[Optional[Decimal]] = mapped_column(MoneyCents, nullable=True)
 
     # Business focus
     therapeutic_focus: Mapped[Optional[List[str]]] = mapped_column(
-        ARRAY(String(100)), nullable=True, index=True
+        portable_array(String(100)), nullable=True
     )
     business_model: Mapped[Optional[str]] = mapped_column(
         String(100), nullable=True
     )  # big_pharma, biotech, generic, etc.
 
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
-    )
-
     # Relationships
     drugs = relationship("Drug", foreign_keys="Drug.company_id", lazy="select")
+    # lazy="raise" so listing endpoints cannot trip an N+1; use
+    # selectinload(Company.partnerships) where the data is actually needed
     partnerships = relationship(
         "CompanyPartnership",
         foreign_keys="CompanyPartnership.company_id",
         back_populates="company",
         cascade="all, delete-orphan",
+        lazy="raise",
     )
 
     def __repr__(self):
-        return f"<Company(id={self.id}, name={self.name})>"
+        # Read straight from __dict__: repr on a detached or partially
+        # loaded row must never trigger instrumentation or a lazy load
+        d = self.__dict__
+        return f"<Company(id={d.get('id')!r}, name={d.get('name')!r})>"
 
 
-class CompanyPartnership(Base):
+class CompanyPartnership(TimestampedUUIDMixin, Base):
     """Company partnership and collaboration model."""
 
     __tablename__ = "company_partnerships"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    company_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("companies.id"), nullable=False, index=True
     )
-    company_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), nullable=False, index=True
-    )
-    partner_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), nullable=False, index=True
+    partner_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("companies.id"), nullable=False, index=True
     )
 
     # Partnership details
     partnership_type: Mapped[str] = mapped_column(
         String(100), nullable=False
     )  # merger, acquisition, collaboration, etc.
-    deal_value: Mapped[Optional[Decimal]] = mapped_column(Numeric(15, 2), nullable=True)
+    deal_value: Mapped[Optional[Decimal]] = mapped_column(MoneyCents, nullable=True)
     currency: Mapped[Optional[str]] = mapped_column(String(3), nullable=True)
 
     # Partnership scope
     therapeutic_areas: Mapped[Optional[List[str]]] = mapped_column(
-        ARRAY(String(100)), nullable=True
+        portable_array(String(100)), nullable=True
     )
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -111,14 +130,6 @@ class CompanyPartnership(Base):
         String(50), nullable=False, default="active"
     )  # active, completed, terminated
 
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
-    )
-
     # Relationships
     company = relationship(
         "Company", foreign_keys=[company_id], back_populates="partnerships"
@@ -126,12 +137,33 @@ class CompanyPartnership(Base):
     partner = relationship("Company", foreign_keys=[partner_id])
 
     def __repr__(self):
-        return f"<CompanyPartnership(company_id={self.company_id}, partner_id={self.partner_id}, type={self.partnership_type})>"
+        d = self.__dict__
+        return (
+            f"<CompanyPartnership(company_id={d.get('company_id')!r}, "
+            f"partner_id={d.get('partner_id')!r}, "
+            f"type={d.get('partnership_type')!r})>"
+        )
 
 
 # Create indexes for performance
 Index("idx_companies_name", Company.name)
 Index("idx_companies_country", Company.country)
 Index("idx_companies_ticker", Company.ticker)
-Index("idx_companies_market_cap", Company.market_cap)
-Index("idx_companies_therapeutic_focus", Company.therapeutic_focus)
+# Ranking queries only look at companies with a known market cap, so skip
+# the NULL rows entirely
+Index(
+    "idx_companies_market_cap",
+    Company.market_cap,
+    postgresql_where=Company.market_cap.isnot(None),
+)
+# GIN posting lists answer containment queries like
+# therapeutic_focus @> ARRAY['oncology']; a B-tree over array literals cannot
+Index(
+    "idx_companies_therapeutic_focus_gin",
+    Company.therapeutic_focus,
+    postgresql_using="gin",
+)
+
+# updated_at is maintained by a single server-side BEFORE UPDATE trigger
+register_updated_at_trigger("companies")
+register_updated_at_trigger("company_partnerships")
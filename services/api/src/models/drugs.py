@@ -3,29 +3,27 @@ Drug-related database models.
 """
 
 import enum
-import uuid
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Dict, Optional
 
 from sqlalchemy import (
+    DDL,
     Boolean,
     Date,
     DateTime,
-    Enum,
     ForeignKey,
     Index,
     Integer,
-    JSON,
     Numeric,
     String,
     Text,
+    event,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
-from database import Base
+from database import Base, EnumAsInt, JSONDoc, UUIDStr, uuid4_str
 
 
 class DrugStatusEnum(enum.Enum):
@@ -58,15 +56,15 @@ class Drug(Base):
 
     __tablename__ = "drugs"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    id: Mapped[str] = mapped_column(
+        UUIDStr, primary_key=True, default=uuid4_str
     )
-    name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
     generic_name: Mapped[Optional[str]] = mapped_column(
         String(200), nullable=True, index=True
     )
     status: Mapped[DrugStatusEnum] = mapped_column(
-        Enum(DrugStatusEnum), nullable=False, index=True
+        EnumAsInt(DrugStatusEnum), nullable=False, index=True
     )
     therapeutic_area: Mapped[str] = mapped_column(
         String(100), nullable=False, index=True
@@ -74,53 +72,81 @@ class Drug(Base):
     indication: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Company relationship
-    company_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False, index=True
+    company_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("companies.id"), nullable=False, index=True
     )
 
-    # Drug details
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    mechanism_of_action: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Drug details. The wide Text columns are deferred: they are only
+    # rendered on the detail view, so default SELECTs skip them (and their
+    # TOAST detoast cost); opt back in with undefer_group("details")
+    description: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="details"
+    )
+    mechanism_of_action: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="details"
+    )
     dosage_form: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     route_of_administration: Mapped[Optional[str]] = mapped_column(
         String(100), nullable=True
     )
-    target_population: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    target_population: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="details"
+    )
 
     # Market information
     market_size: Mapped[Optional[Decimal]] = mapped_column(
         Numeric(15, 2), nullable=True
     )
-    approval_date: Mapped[Optional[date]] = mapped_column(
-        Date, nullable=True, index=True
-    )
+    approval_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=func.now(),
     )
 
-    # Relationships
+    # Relationships; lazy="raise_on_sql" turns any implicit per-row load
+    # into an immediate error, so routes must batch-fetch children with
+    # selectinload()/joinedload() instead of tripping N+1 selects
     regulatory_statuses = relationship(
-        "DrugRegulatoryStatus", back_populates="drug", cascade="all, delete-orphan"
+        "DrugRegulatoryStatus",
+        back_populates="drug",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     patents = relationship(
-        "DrugPatent", back_populates="drug", cascade="all, delete-orphan"
+        "DrugPatent",
+        back_populates="drug",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     new_entries = relationship(
-        "NewDrugEntry", back_populates="drug", cascade="all, delete-orphan"
+        "NewDrugEntry",
+        back_populates="drug",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     analytics = relationship(
-        "DrugAnalytics", back_populates="drug", cascade="all, delete-orphan"
+        "DrugAnalytics",
+        back_populates="drug",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     adverse_events = relationship(
-        "AdverseEvent", back_populates="drug", cascade="all, delete-orphan"
+        "AdverseEvent",
+        back_populates="drug",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     clinical_trials = relationship(
-        "ClinicalTrial", back_populates="drug", cascade="all, delete-orphan"
+        "ClinicalTrial",
+        back_populates="drug",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     def __repr__(self):
@@ -132,11 +158,11 @@ class DrugRegulatoryStatus(Base):
 
     __tablename__ = "drug_regulatory_status"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    id: Mapped[str] = mapped_column(
+        UUIDStr, primary_key=True, default=uuid4_str
     )
-    drug_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("drugs.id"), nullable=False, index=True
+    drug_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("drugs.id"), nullable=False, index=True
     )
     authority: Mapped[str] = mapped_column(
         String(50), nullable=False, index=True
@@ -150,14 +176,18 @@ class DrugRegulatoryStatus(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=func.now(),
     )
 
     # Relationship
-    drug = relationship("Drug", back_populates="regulatory_statuses")
+    drug = relationship(
+        "Drug", back_populates="regulatory_statuses", lazy="raise_on_sql"
+    )
 
     def __repr__(self):
         return f"<DrugRegulatoryStatus(drug_id={self.drug_id}, authority={self.authority})>"
@@ -168,14 +198,18 @@ class DrugPatent(Base):
 
     __tablename__ = "drug_patents"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    id: Mapped[str] = mapped_column(
+        UUIDStr, primary_key=True, default=uuid4_str
     )
-    drug_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("drugs.id"), nullable=False, index=True
+    drug_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("drugs.id"), nullable=False, index=True
     )
     patent_number: Mapped[str] = mapped_column(String(100), nullable=False)
-    title: Mapped[str] = mapped_column(Text, nullable=False)
+    # Deferred for the same reason as Drug's detail columns: patent titles
+    # are long Text rarely needed outside the patent detail view
+    title: Mapped[str] = mapped_column(
+        Text, nullable=False, deferred=True, deferred_group="details"
+    )
     patent_type: Mapped[str] = mapped_column(
         String(50), nullable=False
     )  # composition, method, formulation, etc.
@@ -193,14 +227,16 @@ class DrugPatent(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=func.now(),
     )
 
     # Relationship
-    drug = relationship("Drug", back_populates="patents")
+    drug = relationship("Drug", back_populates="patents", lazy="raise_on_sql")
 
     def __repr__(self):
         return (
@@ -208,19 +244,69 @@ class DrugPatent(Base):
         )
 
 
+class AdverseEvent(Base):
+    """Reported adverse event for a drug."""
+
+    __tablename__ = "adverse_events"
+
+    id: Mapped[str] = mapped_column(
+        UUIDStr, primary_key=True, default=uuid4_str
+    )
+    drug_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("drugs.id"), nullable=False, index=True
+    )
+    event_term: Mapped[str] = mapped_column(
+        String(200), nullable=False, index=True
+    )  # MedDRA preferred term
+    seriousness: Mapped[str] = mapped_column(
+        String(50), nullable=False
+    )  # serious, non_serious
+    outcome: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True
+    )  # recovered, ongoing, fatal, etc.
+    report_date: Mapped[Optional[date]] = mapped_column(
+        Date, nullable=True, index=True
+    )
+    report_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    # Patient demographics
+    patient_age: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    patient_sex: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    country: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+
+    # Source report data as JSON
+    details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONDoc, nullable=True)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=func.now(),
+    )
+
+    # Relationship
+    drug = relationship("Drug", back_populates="adverse_events", lazy="raise_on_sql")
+
+    def __repr__(self):
+        return f"<AdverseEvent(drug_id={self.drug_id}, event_term={self.event_term})>"
+
+
 class NewDrugEntry(Base):
     """Tracks new drug entries and changes."""
 
     __tablename__ = "new_drug_entries"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    id: Mapped[str] = mapped_column(
+        UUIDStr, primary_key=True, default=uuid4_str
     )
-    drug_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("drugs.id"), nullable=False, index=True
+    drug_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("drugs.id"), nullable=False, index=True
     )
     entry_type: Mapped[NewDrugEntryTypeEnum] = mapped_column(
-        Enum(NewDrugEntryTypeEnum), nullable=False, index=True
+        EnumAsInt(NewDrugEntryTypeEnum), nullable=False, index=True
     )
     entry_date: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, index=True
@@ -230,44 +316,59 @@ class NewDrugEntry(Base):
     )  # approved, pending, investigational
 
     # Change details as JSON
-    changes: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    changes: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONDoc, nullable=True)
     regulatory_info: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON, nullable=True
+        JSONDoc, nullable=True
+    )
+    market_impact: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSONDoc, nullable=True
     )
-    market_impact: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
 
     # Description
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=func.now(),
     )
 
     # Relationship
-    drug = relationship("Drug", back_populates="new_entries")
+    drug = relationship("Drug", back_populates="new_entries", lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<NewDrugEntry(drug_id={self.drug_id}, entry_type={self.entry_type})>"
 
 
 class DrugAnalytics(Base):
-    """Drug analytics and performance metrics."""
+    """Drug analytics and performance metrics.
+
+    Partitioned by RANGE on period_start on PostgreSQL: a six-month
+    window scan touches only the partitions covering that window
+    instead of the whole heap. A DEFAULT partition created alongside
+    the table (see below) accepts all rows until monthly partitions are
+    attached; PostgreSQL requires the partition key in the primary key,
+    hence the composite (id, period_start). Other dialects ignore the
+    partition clause and build one plain table.
+    """
 
     __tablename__ = "drug_analytics"
+    __table_args__ = {"postgresql_partition_by": "RANGE (period_start)"}
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    id: Mapped[str] = mapped_column(
+        UUIDStr, primary_key=True, default=uuid4_str
     )
-    drug_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("drugs.id"), nullable=False, index=True
+    drug_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("drugs.id"), nullable=False, index=True
     )
 
-    # Time period for this analytics record
-    period_start: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    # Time period for this analytics record; period_start is covered by
+    # the BRIN index declared below, not index=True
+    period_start: Mapped[date] = mapped_column(Date, nullable=False, primary_key=True)
     period_end: Mapped[date] = mapped_column(Date, nullable=False, index=True)
 
     # Market performance metrics
@@ -288,43 +389,85 @@ class DrugAnalytics(Base):
 
     # Competitive data as JSON
     competitive_landscape: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON, nullable=True
+        JSONDoc, nullable=True
     )
 
     # Additional metrics as JSON for flexibility
     additional_metrics: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON, nullable=True
+        JSONDoc, nullable=True
     )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=func.now(),
     )
 
     # Relationship
-    drug = relationship("Drug", back_populates="analytics")
+    drug = relationship("Drug", back_populates="analytics", lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<DrugAnalytics(drug_id={self.drug_id}, period={self.period_start}-{self.period_end})>"
 
 
-# Create indexes for performance
-Index("idx_drugs_name", Drug.name)
-Index("idx_drugs_generic_name", Drug.generic_name)
-Index("idx_drugs_status", Drug.status)
-Index("idx_drugs_therapeutic_area", Drug.therapeutic_area)
-Index("idx_drugs_company_id", Drug.company_id)
-Index("idx_drugs_approval_date", Drug.approval_date)
-Index("idx_new_drug_entries_drug_id", NewDrugEntry.drug_id)
-Index("idx_new_drug_entries_type", NewDrugEntry.entry_type)
-Index("idx_new_drug_entries_date", NewDrugEntry.entry_date)
-Index("idx_new_drug_entries_status", NewDrugEntry.status)
-Index("idx_drug_regulatory_status_drug_id", DrugRegulatoryStatus.drug_id)
-Index("idx_drug_regulatory_status_authority", DrugRegulatoryStatus.authority)
-Index("idx_drug_patents_drug_id", DrugPatent.drug_id)
-Index("idx_drug_patents_expiration", DrugPatent.expiration_date)
-Index("idx_drug_analytics_drug_id", DrugAnalytics.drug_id)
-Index("idx_drug_analytics_period", DrugAnalytics.period_start, DrugAnalytics.period_end)
+# Create indexes for performance. Single-column indexes come from index=True
+# on the mapped columns; only genuinely composite indexes are declared here -
+# a standalone Index() over an index=True column builds a second identical
+# B-tree that every INSERT/UPDATE must also maintain.
+
+# No migration tooling exists yet to attach monthly partitions, so a
+# DEFAULT partition catches every row on PostgreSQL until one does;
+# monthly partitions split off from it later without touching the model
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS drug_analytics_default "
+        "PARTITION OF drug_analytics DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+# Analytics rows append in period order, so block ranges are strongly
+# correlated with period_start; a BRIN index is orders of magnitude
+# smaller than a btree and prunes whole block ranges on window scans
+# (plain index off PostgreSQL)
+Index(
+    "idx_drug_analytics_period_brin",
+    DrugAnalytics.period_start,
+    postgresql_using="brin",
+)
+
+# List views order by approval_date and render name/status/therapeutic_area;
+# INCLUDE keeps those payload columns in the leaf pages so the query is an
+# index-only scan with no heap probes (PostgreSQL only - other dialects
+# build a plain index on approval_date)
+Index(
+    "idx_drugs_list",
+    Drug.approval_date,
+    postgresql_include=["name", "status", "therapeutic_area"],
+)
+
+# Backs both name lookups and the (name, id) keyset seek used by cursor
+# pagination; subsumes a single-column index on name
+Index("idx_drugs_name_id", Drug.name, Drug.id)
+
+# jsonb_path_ops GIN indexes serve @> containment filters over the document
+# columns with roughly half the index size of the default jsonb_ops opclass;
+# queries should use col.op("@>")({...}) to hit them
+for _name, _col in (
+    ("idx_new_drug_entries_changes_gin", NewDrugEntry.changes),
+    ("idx_new_drug_entries_regulatory_gin", NewDrugEntry.regulatory_info),
+    ("idx_new_drug_entries_market_gin", NewDrugEntry.market_impact),
+    ("idx_drug_analytics_landscape_gin", DrugAnalytics.competitive_landscape),
+    ("idx_drug_analytics_metrics_gin", DrugAnalytics.additional_metrics),
+):
+    Index(
+        _name,
+        _col,
+        postgresql_using="gin",
+        postgresql_ops={_col.key: "jsonb_path_ops"},
+    )
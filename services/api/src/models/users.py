@@ -2,16 +2,14 @@
 User and authentication related models.
 """
 
-import uuid
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
-from database import Base
+from database import Base, EpochTS, UUIDStr, uuid4_str
 
 
 class User(Base):
@@ -19,8 +17,8 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    id: Mapped[str] = mapped_column(
+        UUIDStr, primary_key=True, default=uuid4_str
     )
     email: Mapped[str] = mapped_column(
         String(255), unique=True, nullable=False, index=True
@@ -35,10 +33,9 @@ class User(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     is_verified: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
-    # Authentication metadata
-    last_login: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True), nullable=True
-    )
+    # Authentication metadata; EpochTS columns surface as int epoch
+    # seconds - nothing downstream wants a datetime for these
+    last_login: Mapped[Optional[int]] = mapped_column(EpochTS, nullable=True)
     failed_login_attempts: Mapped[int] = mapped_column(
         Integer, nullable=False, default=0
     )
@@ -53,21 +50,33 @@ class User(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=func.now(),
     )
 
-    # Relationships
+    # Relationships; lazy="raise_on_sql" makes an implicit lazy load an
+    # error so callers batch-fetch with selectinload() instead
     api_keys = relationship(
-        "ApiKey", back_populates="user", cascade="all, delete-orphan"
+        "ApiKey",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     refresh_tokens = relationship(
-        "RefreshToken", back_populates="user", cascade="all, delete-orphan"
+        "RefreshToken",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     user_sessions = relationship(
-        "UserSession", back_populates="user", cascade="all, delete-orphan"
+        "UserSession",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     def __repr__(self):
@@ -79,20 +88,18 @@ class ApiKey(Base):
 
     __tablename__ = "api_keys"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    id: Mapped[str] = mapped_column(
+        UUIDStr, primary_key=True, default=uuid4_str
     )
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
+    user_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("users.id"), nullable=False, index=True
     )
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     key_hash: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
 
-    # Usage tracking
-    last_used: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True), nullable=True
-    )
+    # Usage tracking; last_used surfaces as int epoch seconds
+    last_used: Mapped[Optional[int]] = mapped_column(EpochTS, nullable=True)
     usage_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     # Expiration
@@ -102,14 +109,16 @@ class ApiKey(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=func.now(),
     )
 
     # Relationship
-    user = relationship("User", back_populates="api_keys")
+    user = relationship("User", back_populates="api_keys", lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<ApiKey(id={self.id}, user_id={self.user_id}, name={self.name})>"
@@ -120,11 +129,11 @@ class RefreshToken(Base):
 
     __tablename__ = "refresh_tokens"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    id: Mapped[str] = mapped_column(
+        UUIDStr, primary_key=True, default=uuid4_str
     )
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
+    user_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("users.id"), nullable=False, index=True
     )
     token_hash: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
@@ -143,14 +152,12 @@ class RefreshToken(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
-    )
-    last_used: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True), nullable=True
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
     )
+    last_used: Mapped[Optional[int]] = mapped_column(EpochTS, nullable=True)
 
     # Relationship
-    user = relationship("User", back_populates="refresh_tokens")
+    user = relationship("User", back_populates="refresh_tokens", lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<RefreshToken(id={self.id}, user_id={self.user_id})>"
@@ -161,11 +168,11 @@ class UserSession(Base):
 
     __tablename__ = "user_sessions"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    id: Mapped[str] = mapped_column(
+        UUIDStr, primary_key=True, default=uuid4_str
     )
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
+    user_id: Mapped[str] = mapped_column(
+        UUIDStr, ForeignKey("users.id"), nullable=False, index=True
     )
     session_token: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
@@ -179,23 +186,40 @@ class UserSession(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
     )
-    last_accessed: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    last_accessed: Mapped[Optional[int]] = mapped_column(
+        EpochTS,
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=func.now(),
     )
 
     # Relationship
-    user = relationship("User", back_populates="user_sessions")
+    user = relationship("User", back_populates="user_sessions", lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<UserSession(id={self.id}, user_id={self.user_id})>"
 
 
-# Create indexes for performance
-Index("idx_users_email", User.email)
+# Create indexes for performance. Columns with index=True already get their
+# own B-tree, so only indexes without an inline declaration live here -
+# duplicating them doubles index maintenance on every write.
 Index("idx_users_organization", User.organization)
 Index("idx_users_created_at", User.created_at)
-Index("idx_api_keys_user_id", ApiKey.user_id)
-Index("idx_refresh_tokens_user_id", RefreshToken.user_id)
 Index("idx_refresh_tokens_expires_at", RefreshToken.expires_at)
+
+# Token lookups and the expiry sweep filter on is_active = true AND
+# expires_at > now(); partial indexes hold only the live rows, so they
+# stay a fraction of the full btree's size and revoked/expired rows add
+# no index-maintenance cost on write (PostgreSQL only - SQLite ignores
+# the dialect-prefixed predicate and builds a plain index)
+Index(
+    "idx_refresh_tokens_active_exp",
+    RefreshToken.expires_at,
+    postgresql_where=RefreshToken.is_active.is_(True),
+)
+Index(
+    "idx_user_sessions_active",
+    UserSession.user_id,
+    postgresql_where=UserSession.is_active.is_(True),
+)
@@ -5,9 +5,17 @@ Authentication endpoints.
 from datetime import timedelta
 
 from exceptions import AuthenticationError
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
 from middleware.auth import auth_service, AuthenticationService
-from schemas.auth import LoginRequest, RefreshTokenRequest, TokenResponse
+from pydantic import ValidationError
+from schemas.auth import (
+    ACCESS_TOKEN_TTL_SECONDS,
+    LOGIN_REQUEST_ADAPTER,
+    REFRESH_REQUEST_ADAPTER,
+    TokenResponse,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db_session
@@ -15,15 +23,44 @@ from database import get_db_session
 router = APIRouter()
 
 
+def get_auth_service() -> AuthenticationService:
+    """Dependency returning the process-wide authentication service.
+
+    A named function (instead of the previous per-route lambda) lets
+    FastAPI cache the solved dependency by identity and share it across
+    every route that needs the service.
+    """
+    return auth_service
+
+# The refresh response is the TokenResponse shape with every field but the
+# token known at import time, and the token itself is base64url (never
+# needs JSON escaping). Concatenating around the prebuilt halves skips
+# Pydantic construction and serialization on this hot path entirely; the
+# response_model on the route is kept for the OpenAPI schema.
+_REFRESH_BODY_PREFIX = b'{"access_token":"'
+_REFRESH_BODY_SUFFIX = (
+    b'","refresh_token":null,"token_type":"bearer","expires_in":'
+    + str(ACCESS_TOKEN_TTL_SECONDS).encode()
+    + b"}"
+)
+
+
 @router.post("/login", response_model=TokenResponse, tags=["Authentication"])
 async def login_user(
-    login_data: LoginRequest,
+    request: Request,
     db: AsyncSession = Depends(get_db_session),
-    auth: AuthenticationService = Depends(lambda: auth_service),
+    auth: AuthenticationService = Depends(get_auth_service),
 ):
     """
     Authenticate user and return access token.
     """
+    # Single-pass body decode via the precompiled adapter; re-raised as
+    # RequestValidationError so the registered 422 handler still applies
+    try:
+        login_data = LOGIN_REQUEST_ADAPTER.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors())
+
     # Authenticate user
     user_data = await auth.authenticate_user(login_data.email, login_data.password)
     if not user_data:
@@ -39,21 +76,22 @@ async def login_user(
     access_token = auth.create_access_token(token_data)
     refresh_token = auth.create_refresh_token({"sub": user_data["user_id"]})
 
-    return TokenResponse(
-        access_token=access_token,
-        refresh_token=refresh_token,
-        expires_in=60 * 30,  # 30 minutes
-    )
+    return TokenResponse(access_token=access_token, refresh_token=refresh_token)
 
 
 @router.post("/refresh", response_model=TokenResponse, tags=["Authentication"])
 async def refresh_token(
-    refresh_request: RefreshTokenRequest,
-    auth: AuthenticationService = Depends(lambda: auth_service),
+    request: Request,
+    auth: AuthenticationService = Depends(get_auth_service),
 ):
     """
     Get a new access token using refresh token.
     """
+    try:
+        refresh_request = REFRESH_REQUEST_ADAPTER.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors())
+
     # Verify refresh token
     payload = await auth.verify_token(refresh_request.refresh_token)
     if not payload or payload.get("type") != "refresh":
@@ -72,4 +110,7 @@ async def refresh_token(
 
     access_token = auth.create_access_token(token_data)
 
-    return TokenResponse(access_token=access_token, expires_in=60 * 30)  # 30 minutes
+    return Response(
+        content=_REFRESH_BODY_PREFIX + access_token.encode() + _REFRESH_BODY_SUFFIX,
+        media_type="application/json",
+    )
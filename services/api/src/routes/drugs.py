@@ -1,12 +1,178 @@
 """Drug information endpoints."""
 
+import base64
+import binascii
+import uuid
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from exceptions import ValidationError
 from fastapi import APIRouter, Depends, Path, Query
 from middleware.auth import get_current_user
+from sqlalchemy import bindparam, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from database import get_db_session
+from models.drugs import AdverseEvent, Drug, NewDrugEntry
 
 router = APIRouter()
 
+# Hot list statements are built once at import with bindparam() slots for
+# the values that change per request, so every execution hits the same
+# entry in SQLAlchemy's compiled-statement cache instead of re-walking
+# the select() construction. Filtered variants are built in the handler;
+# their handful of shapes still cache per shape.
+_DRUG_LIST_COLS = load_only(
+    Drug.id,
+    Drug.name,
+    Drug.generic_name,
+    Drug.status,
+    Drug.therapeutic_area,
+    Drug.approval_date,
+)
+# Both pagination styles share the (name, id) order: OFFSET pages must
+# be deterministic, and the cursor they hand out has to resume from the
+# same order the seek statements assume
+_LIST_DRUGS_STMT = (
+    select(Drug)
+    .options(_DRUG_LIST_COLS)
+    .order_by(Drug.name, Drug.id)
+    .limit(bindparam("lim"))
+    .offset(bindparam("off"))
+)
+_COUNT_DRUGS_STMT = select(func.count()).select_from(Drug)
+
+_NEW_ENTRY_LIST_COLS = load_only(
+    NewDrugEntry.id,
+    NewDrugEntry.drug_id,
+    NewDrugEntry.entry_type,
+    NewDrugEntry.entry_date,
+    NewDrugEntry.status,
+)
+_NEW_DRUGS_STMT = (
+    select(NewDrugEntry)
+    .options(_NEW_ENTRY_LIST_COLS)
+    .where(NewDrugEntry.entry_date >= bindparam("cutoff"))
+    .order_by(NewDrugEntry.entry_date.desc(), NewDrugEntry.id.desc())
+    .limit(bindparam("lim"))
+    .offset(bindparam("off"))
+)
+_COUNT_NEW_DRUGS_STMT = (
+    select(func.count())
+    .select_from(NewDrugEntry)
+    .where(NewDrugEntry.entry_date >= bindparam("cutoff"))
+)
+
+# Keyset (seek) variants: OFFSET scans and discards every skipped row, so
+# deep pages cost O(page * limit); seeking past an opaque (sort key, id)
+# cursor reads exactly one page from the composite index no matter how
+# deep the client has paged.
+_SEEK_DRUGS_STMT = (
+    select(Drug)
+    .options(_DRUG_LIST_COLS)
+    .where(
+        # The RHS must also be a tuple_() construct: a plain Python tuple
+        # would be coerced to anonymous literals wrapping the bindparam
+        # objects themselves, never binding the handler's values
+        tuple_(Drug.name, Drug.id)
+        > tuple_(
+            bindparam("name", type_=Drug.name.type),
+            bindparam("id", type_=Drug.id.type),
+        )
+    )
+    .order_by(Drug.name, Drug.id)
+    .limit(bindparam("lim"))
+)
+_ADVERSE_EVENT_LIST_COLS = load_only(
+    AdverseEvent.id,
+    AdverseEvent.event_term,
+    AdverseEvent.seriousness,
+    AdverseEvent.outcome,
+    AdverseEvent.report_date,
+    AdverseEvent.report_count,
+    AdverseEvent.created_at,
+)
+# Adverse events order by (created_at, id) desc: created_at is non-null
+# (report_date is not, which breaks row-value seeks) and newest reports
+# first is the view the endpoint serves
+_ADVERSE_EVENTS_STMT = (
+    select(AdverseEvent)
+    .options(_ADVERSE_EVENT_LIST_COLS)
+    .where(AdverseEvent.drug_id == bindparam("drug_id"))
+    .order_by(AdverseEvent.created_at.desc(), AdverseEvent.id.desc())
+    .limit(bindparam("lim"))
+    .offset(bindparam("off"))
+)
+_COUNT_ADVERSE_EVENTS_STMT = (
+    select(func.count())
+    .select_from(AdverseEvent)
+    .where(AdverseEvent.drug_id == bindparam("drug_id"))
+)
+
+_SEEK_NEW_DRUGS_STMT = (
+    select(NewDrugEntry)
+    .options(_NEW_ENTRY_LIST_COLS)
+    .where(NewDrugEntry.entry_date >= bindparam("cutoff"))
+    .where(
+        tuple_(NewDrugEntry.entry_date, NewDrugEntry.id)
+        < tuple_(
+            bindparam("entry_date", type_=NewDrugEntry.entry_date.type),
+            bindparam("id", type_=NewDrugEntry.id.type),
+        )
+    )
+    .order_by(NewDrugEntry.entry_date.desc(), NewDrugEntry.id.desc())
+    .limit(bindparam("lim"))
+)
+_SEEK_ADVERSE_EVENTS_STMT = (
+    select(AdverseEvent)
+    .options(_ADVERSE_EVENT_LIST_COLS)
+    .where(AdverseEvent.drug_id == bindparam("drug_id"))
+    .where(
+        tuple_(AdverseEvent.created_at, AdverseEvent.id)
+        < tuple_(
+            bindparam("created_at", type_=AdverseEvent.created_at.type),
+            bindparam("id", type_=AdverseEvent.id.type),
+        )
+    )
+    .order_by(AdverseEvent.created_at.desc(), AdverseEvent.id.desc())
+    .limit(bindparam("lim"))
+)
+
+
+def _encode_cursor(*parts: str) -> str:
+    """Pack cursor fields into an opaque URL-safe token."""
+    return base64.urlsafe_b64encode("|".join(parts).encode()).decode()
+
+
+def _decode_cursor(cursor: str, fields: int) -> list:
+    """Unpack a cursor token, rejecting anything malformed."""
+    try:
+        decoded = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValidationError("Invalid cursor")
+    # Splitting from the right keeps the delimiter usable inside the
+    # leading field (drug names may contain "|"); the trailing fields are
+    # always delimiter-free values such as ids and dates
+    parts = decoded.rsplit("|", fields - 1)
+    if len(parts) != fields:
+        raise ValidationError("Invalid cursor")
+    return parts
+
+
+def _drug_list_row(drug: Drug) -> dict:
+    """Shape a projected Drug row for the list payload."""
+    return {
+        "id": str(drug.id),
+        "name": drug.name,
+        "generic_name": drug.generic_name,
+        "status": drug.status.value,
+        "therapeutic_area": drug.therapeutic_area,
+        "approval_date": (
+            drug.approval_date.isoformat() if drug.approval_date else None
+        ),
+    }
+
 
 @router.get("/", tags=["Drugs"])
 async def list_drugs(
@@ -14,11 +180,137 @@ async def list_drugs(
     limit: int = Query(20, ge=1, le=100),
     search: Optional[str] = Query(None),
     therapeutic_area: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
     current_user=Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
 ):
-    """Get paginated list of drugs with optional filtering."""
-    # Implementation would query database
-    return {"data": [], "meta": {"page": page, "limit": limit, "total": 0, "pages": 0}}
+    """Get paginated list of drugs with optional filtering.
+
+    Passing ``cursor`` (the ``next_cursor`` of a previous page) switches
+    to keyset pagination, which stays O(limit) at any depth; ``page`` is
+    the OFFSET fallback and gets slower the deeper it goes.
+    """
+    seek = None
+    if cursor is not None:
+        name, last_id = _decode_cursor(cursor, 2)
+        try:
+            seek = (name, uuid.UUID(last_id))
+        except ValueError:
+            raise ValidationError("Invalid cursor")
+
+    # The projection (load_only) keeps the wide Text columns out of the
+    # SELECT so the database never detoasts bytes nobody will see
+    if search or therapeutic_area:
+        stmt = select(Drug).options(_DRUG_LIST_COLS)
+        count_stmt = _COUNT_DRUGS_STMT
+        if search:
+            pattern = f"%{search}%"
+            condition = Drug.name.ilike(pattern) | Drug.generic_name.ilike(pattern)
+            stmt = stmt.where(condition)
+            count_stmt = count_stmt.where(condition)
+        if therapeutic_area:
+            stmt = stmt.where(Drug.therapeutic_area == therapeutic_area)
+            count_stmt = count_stmt.where(Drug.therapeutic_area == therapeutic_area)
+        if seek is not None:
+            stmt = stmt.where(tuple_(Drug.name, Drug.id) > seek)
+            stmt = stmt.order_by(Drug.name, Drug.id).limit(limit)
+        else:
+            stmt = stmt.order_by(Drug.name, Drug.id)
+            stmt = stmt.offset((page - 1) * limit).limit(limit)
+        params = {}
+    elif seek is not None:
+        stmt = _SEEK_DRUGS_STMT
+        count_stmt = _COUNT_DRUGS_STMT
+        params = {"name": seek[0], "id": seek[1], "lim": limit}
+    else:
+        stmt = _LIST_DRUGS_STMT
+        count_stmt = _COUNT_DRUGS_STMT
+        params = {"lim": limit, "off": (page - 1) * limit}
+
+    total = (await db.execute(count_stmt)).scalar_one()
+    result = await db.execute(stmt, params)
+    drugs = result.scalars().all()
+
+    next_cursor = None
+    if len(drugs) == limit:
+        last = drugs[-1]
+        next_cursor = _encode_cursor(last.name, str(last.id))
+
+    return {
+        "data": [_drug_list_row(drug) for drug in drugs],
+        "meta": {
+            "page": page,
+            "limit": limit,
+            "total": total,
+            "pages": (total + limit - 1) // limit,
+            "next_cursor": next_cursor,
+        },
+    }
+
+
+@router.get("/new", tags=["Drugs"])
+async def get_new_drugs(
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    days_back: int = Query(30, ge=1, le=365),
+    cursor: Optional[str] = Query(None),
+    current_user=Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Get recently added drug entries."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+
+    # Same projection discipline as list_drugs: skip the JSON document
+    # columns (changes, regulatory_info, market_impact) on the list view
+    total = (await db.execute(_COUNT_NEW_DRUGS_STMT, {"cutoff": cutoff})).scalar_one()
+
+    if cursor is not None:
+        entry_date_raw, last_id = _decode_cursor(cursor, 2)
+        try:
+            seek_date = datetime.fromisoformat(entry_date_raw)
+            seek_id = uuid.UUID(last_id)
+        except ValueError:
+            raise ValidationError("Invalid cursor")
+        result = await db.execute(
+            _SEEK_NEW_DRUGS_STMT,
+            {
+                "cutoff": cutoff,
+                "entry_date": seek_date,
+                "id": seek_id,
+                "lim": limit,
+            },
+        )
+    else:
+        result = await db.execute(
+            _NEW_DRUGS_STMT,
+            {"cutoff": cutoff, "lim": limit, "off": (page - 1) * limit},
+        )
+    entries = result.scalars().all()
+
+    next_cursor = None
+    if len(entries) == limit:
+        last = entries[-1]
+        next_cursor = _encode_cursor(last.entry_date.isoformat(), str(last.id))
+
+    return {
+        "data": [
+            {
+                "id": str(entry.id),
+                "drug_id": str(entry.drug_id),
+                "entry_type": entry.entry_type.value,
+                "entry_date": entry.entry_date.isoformat(),
+                "status": entry.status,
+            }
+            for entry in entries
+        ],
+        "meta": {
+            "page": page,
+            "limit": limit,
+            "total": total,
+            "pages": (total + limit - 1) // limit,
+            "next_cursor": next_cursor,
+        },
+    }
 
 
 @router.get("/{drug_id}", tags=["Drugs"])
@@ -45,18 +337,71 @@ async def get_drug_adverse_events(
     drug_id: str = Path(...),
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
     current_user=Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
 ):
     """Get adverse event data for a drug."""
-    return {"data": [], "meta": {"page": page, "limit": limit, "total": 0, "pages": 0}}
+    try:
+        drug_uuid = uuid.UUID(drug_id)
+    except ValueError:
+        raise ValidationError("Invalid drug id")
+
+    # Projection skips the details JSON document on the list view, same
+    # discipline as the other list endpoints
+    total = (
+        await db.execute(_COUNT_ADVERSE_EVENTS_STMT, {"drug_id": drug_uuid})
+    ).scalar_one()
+
+    if cursor is not None:
+        created_at_raw, last_id = _decode_cursor(cursor, 2)
+        try:
+            seek_created = datetime.fromisoformat(created_at_raw)
+            seek_id = uuid.UUID(last_id)
+        except ValueError:
+            raise ValidationError("Invalid cursor")
+        result = await db.execute(
+            _SEEK_ADVERSE_EVENTS_STMT,
+            {
+                "drug_id": drug_uuid,
+                "created_at": seek_created,
+                "id": seek_id,
+                "lim": limit,
+            },
+        )
+    else:
+        result = await db.execute(
+            _ADVERSE_EVENTS_STMT,
+            {"drug_id": drug_uuid, "lim": limit, "off": (page - 1) * limit},
+        )
+    events = result.scalars().all()
+
+    next_cursor = None
+    if len(events) == limit:
+        last = events[-1]
+        next_cursor = _encode_cursor(last.created_at.isoformat(), str(last.id))
+
+    return {
+        "data": [
+            {
+                "id": str(event.id),
+                "event_term": event.event_term,
+                "seriousness": event.seriousness,
+                "outcome": event.outcome,
+                "report_date": (
+                    event.report_date.isoformat() if event.report_date else None
+                ),
+                "report_count": event.report_count,
+            }
+            for event in events
+        ],
+        "meta": {
+            "page": page,
+            "limit": limit,
+            "total": total,
+            "pages": (total + limit - 1) // limit,
+            "next_cursor": next_cursor,
+        },
+    }
 
 
-@router.get("/new", tags=["Drugs"])
-async def get_new_drugs(
-    page: int = Query(1, ge=1),
-    limit: int = Query(20, ge=1, le=100),
-    days_back: int = Query(30, ge=1, le=365),
-    current_user=Depends(get_current_user),
-):
-    """Get recently added drug entries."""
-    return {"data": [], "meta": {"page": page, "limit": limit, "total": 0, "pages": 0}}
@@ -9,12 +9,18 @@ from pathlib import Path
 import fakeredis.aioredis
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient
+from passlib.context import CryptContext
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, create_async_engine
 from sqlalchemy.pool import StaticPool
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path for imports - conftest loads before every test module,
+# so this is the one place the bootstrap needs to live; the guard keeps
+# sys.path free of duplicates (every import scans it linearly)
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from config import get_settings, Settings
 from main import app
@@ -23,6 +29,19 @@ from middleware.auth import auth_service
 from database import Base, database, get_db_session, get_redis_client
 
 
+# Bcrypt is deliberately slow (~tens of ms per hash); the fixtures and
+# auth tests only ever hash a couple of fixed plaintexts, so one bcrypt
+# invocation per plaintext serves the whole suite.
+_PASSWORD_HASHES: dict = {}
+
+
+def cached_password_hash(password: str) -> str:
+    """Return the bcrypt hash for a test plaintext, computing it once."""
+    if password not in _PASSWORD_HASHES:
+        _PASSWORD_HASHES[password] = auth_service.get_password_hash(password)
+    return _PASSWORD_HASHES[password]
+
+
 class TestSettings(Settings):
     """Test-specific settings."""
 
@@ -34,10 +53,31 @@ class TestSettings(Settings):
     secret_key: str = "test-secret-key"
 
 
+# Bcrypt's default cost is tuned against offline attackers, which is
+# wasted CPU on throwaway fixture rows; rounds=4 (the scheme minimum)
+# keeps the exact same hash/verify code path ~256x cheaper. Swapped on
+# the process-wide service only under the testing environment, so
+# production cost still comes from Settings.
+if TestSettings().environment == "testing":
+    auth_service.pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+
+
 # Note: Using pytest-asyncio's built-in event loop instead of custom one
 
 
-@pytest_asyncio.fixture(scope="function")
+def pytest_collection_modifyitems(items):
+    """Run asyncio tests on the session loop.
+
+    The engine fixture below is session-scoped and aiosqlite connections
+    are bound to the event loop they were created on, so every test that
+    touches the database has to share that loop.
+    """
+    for item in items:
+        if item.get_closest_marker("asyncio") is not None:
+            item.add_marker(pytest.mark.asyncio(loop_scope="session"), append=False)
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
 async def test_settings():
     """Override settings for testing."""
     original_get_settings = get_settings
@@ -53,10 +93,14 @@ async def test_settings():
         del app.dependency_overrides[get_settings]
 
 
-@pytest_asyncio.fixture(scope="function")
-async def test_db():
-    """Create test database."""
-    # Create in-memory SQLite database for testing
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _db_engine():
+    """Build the in-memory engine and schema once per session.
+
+    create_all walks every ORM table and was the dominant per-test
+    fixture cost when the engine was function-scoped; tests now isolate
+    through the transaction rollback in test_db instead.
+    """
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         poolclass=StaticPool,
@@ -64,16 +108,43 @@ async def test_db():
         echo=False,
     )
 
+    # The sqlite driver defers BEGIN and implicitly commits around it,
+    # which silently breaks the outer-transaction rollback that test_db
+    # relies on; take over transaction control per the SQLAlchemy
+    # pysqlite docs so BEGIN/ROLLBACK mean what they say
+    @event.listens_for(engine.sync_engine, "connect")
+    def _do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def test_db(_db_engine):
+    """Create test database."""
+    # Join-external-transaction pattern: everything the test and the app
+    # do runs inside one outer transaction on one connection; session
+    # commits become SAVEPOINT releases and the teardown rollback wipes
+    # the test's writes without any DROP/CREATE
+    connection = await _db_engine.connect()
+    transaction = await connection.begin()
+
     async_session_factory = async_sessionmaker(
-        bind=engine,
+        bind=connection,
         class_=AsyncSession,
         expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
 
-    # Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
     # Override database dependency
     async def override_get_db():
         async with async_session_factory() as session:
@@ -91,15 +162,14 @@ async def test_db():
     yield async_session_factory
 
     # Clean up
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    await engine.dispose()
+    await transaction.rollback()
+    await connection.close()
 
     if get_db_session in app.dependency_overrides:
         del app.dependency_overrides[get_db_session]
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
 async def test_redis():
     """Create fake Redis client for testing."""
     fake_redis = fakeredis.aioredis.FakeRedis()
@@ -114,17 +184,36 @@ async def test_redis():
         del app.dependency_overrides[get_redis_client]
 
 
-@pytest_asyncio.fixture(scope="function")
-async def client(test_settings, test_db, test_redis):
-    """Create test client."""
-    from httpx import ASGITransport
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _http_client():
+    """Build the ASGI transport and client once per session.
 
+    Transport construction and the client's enter/exit are pure overhead
+    to repeat per test; the only state a test leaves behind is the
+    Authorization header and cookies, which client resets below.
+    """
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def client(test_settings, test_db, test_redis, _http_client):
+    """Create test client."""
+    _http_client.headers.pop("Authorization", None)
+    _http_client.cookies.clear()
+    yield _http_client
+
+
+# The authenticated client's user gets a fixed id so one minted JWT
+# stays valid for every test that reuses the fixture - tokens are
+# reusable within their validity window, so only the (cheap) row insert
+# needs repeating for the per-test rollback isolation.
+_AUTH_USER_ID = "00000000-0000-4000-8000-000000000001"
+_AUTH_TOKEN: dict = {}
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
 async def authenticated_client(client, test_db):
     """Create authenticated test client."""
     # Create test user
@@ -132,8 +221,9 @@ async def authenticated_client(client, test_db):
         from models.users import User
 
         test_user = User(
+            id=_AUTH_USER_ID,
             email="test@example.com",
-            password_hash=auth_service.get_password_hash("testpass123"),
+            password_hash=cached_password_hash("testpass123"),
             first_name="Test",
             last_name="User",
             role="user",
@@ -142,18 +232,15 @@ async def authenticated_client(client, test_db):
         )
         session.add(test_user)
         await session.commit()
-        await session.refresh(test_user)
 
-        # Create access token
-        token_data = {
-            "sub": str(test_user.id),
-            "email": test_user.email,
-            "role": test_user.role,
-        }
-        access_token = auth_service.create_access_token(token_data)
+    # Mint the access token once and reuse it for the rest of the run
+    if "access_token" not in _AUTH_TOKEN:
+        _AUTH_TOKEN["access_token"] = auth_service.create_access_token(
+            {"sub": _AUTH_USER_ID, "email": "test@example.com", "role": "user"}
+        )
 
     # Set authorization header
-    client.headers.update({"Authorization": f"Bearer {access_token}"})
+    client.headers.update({"Authorization": f"Bearer {_AUTH_TOKEN['access_token']}"})
 
     yield client
 
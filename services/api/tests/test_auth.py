@@ -2,42 +2,52 @@
 Tests for authentication endpoints.
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
+from tests.conftest import cached_password_hash
 from middleware.auth import auth_service
 
 
+@pytest_asyncio.fixture
+async def seeded_user(test_db):
+    """Insert the canonical auth test user and mint its tokens once.
+
+    Every test below needed the same user row plus a token or two; one
+    fixture replaces the per-test insert/hash/sign boilerplate. The
+    test_db rollback wipes the row after each test.
+    """
+    async with test_db() as session:
+        from models.users import User
+
+        user = User(
+            email="testuser@example.com",
+            password_hash=cached_password_hash("password123"),
+            first_name="Test",
+            last_name="User",
+            role="user",
+            is_active=True,
+            is_verified=True,
+        )
+        session.add(user)
+        await session.commit()
+        await session.refresh(user)
+
+        access_token = auth_service.create_access_token(
+            {"sub": str(user.id), "email": user.email, "role": user.role}
+        )
+        refresh_token = auth_service.create_refresh_token({"sub": str(user.id)})
+
+    return user, access_token, refresh_token
+
+
 class TestAuthenticationEndpoints:
     """Test authentication and token management endpoints."""
 
     @pytest.mark.asyncio
-    async def test_login_success(self, client: AsyncClient, test_db):
+    async def test_login_success(self, client: AsyncClient, seeded_user):
         """Test successful login."""
-        # Create test user
-        async with test_db() as session:
-            from models.users import User
-
-            test_user = User(
-                email="testuser@example.com",
-                password_hash=auth_service.get_password_hash("password123"),
-                first_name="Test",
-                last_name="User",
-                role="user",
-                is_active=True,
-                is_verified=True,
-            )
-            session.add(test_user)
-            await session.commit()
-
-        # Test login
         response = await client.post(
             "/auth/login",
             json={"email": "testuser@example.com", "password": "password123"},
@@ -56,24 +66,8 @@ class TestAuthenticationEndpoints:
         assert data["expires_in"] > 0
 
     @pytest.mark.asyncio
-    async def test_login_invalid_credentials(self, client: AsyncClient, test_db):
+    async def test_login_invalid_credentials(self, client: AsyncClient, seeded_user):
         """Test login with invalid credentials."""
-        # Create test user
-        async with test_db() as session:
-            from models.users import User
-
-            test_user = User(
-                email="testuser@example.com",
-                password_hash=auth_service.get_password_hash("password123"),
-                first_name="Test",
-                last_name="User",
-                role="user",
-                is_active=True,
-                is_verified=True,
-            )
-            session.add(test_user)
-            await session.commit()
-
         # Test login with wrong password
         response = await client.post(
             "/auth/login",
@@ -107,28 +101,9 @@ class TestAuthenticationEndpoints:
         assert response.status_code == 422  # Validation error
 
     @pytest.mark.asyncio
-    async def test_refresh_token_success(self, client: AsyncClient, test_db):
+    async def test_refresh_token_success(self, client: AsyncClient, seeded_user):
         """Test successful token refresh."""
-        # Create test user and get tokens
-        async with test_db() as session:
-            from models.users import User
-
-            test_user = User(
-                email="testuser@example.com",
-                password_hash=auth_service.get_password_hash("password123"),
-                first_name="Test",
-                last_name="User",
-                role="user",
-                is_active=True,
-                is_verified=True,
-            )
-            session.add(test_user)
-            await session.commit()
-            await session.refresh(test_user)
-
-            # Create refresh token
-            token_data = {"sub": str(test_user.id)}
-            refresh_token = auth_service.create_refresh_token(token_data)
+        _, _, refresh_token = seeded_user
 
         # Test token refresh
         response = await client.post(
@@ -157,33 +132,10 @@ class TestAuthenticationEndpoints:
 
     @pytest.mark.asyncio
     async def test_refresh_token_access_token_provided(
-        self, client: AsyncClient, test_db
+        self, client: AsyncClient, seeded_user
     ):
         """Test refresh with access token instead of refresh token."""
-        # Create test user and get access token
-        async with test_db() as session:
-            from models.users import User
-
-            test_user = User(
-                email="testuser@example.com",
-                password_hash=auth_service.get_password_hash("password123"),
-                first_name="Test",
-                last_name="User",
-                role="user",
-                is_active=True,
-                is_verified=True,
-            )
-            session.add(test_user)
-            await session.commit()
-            await session.refresh(test_user)
-
-            # Create access token (not refresh token)
-            token_data = {
-                "sub": str(test_user.id),
-                "email": test_user.email,
-                "role": test_user.role,
-            }
-            access_token = auth_service.create_access_token(token_data)
+        _, access_token, _ = seeded_user
 
         # Test refresh with access token
         response = await client.post(
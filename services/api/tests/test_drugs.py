@@ -3,6 +3,7 @@ Tests for drug information endpoints.
 """
 
 import uuid
+from datetime import datetime, timedelta
 
 import pytest
 import pytest_asyncio
@@ -71,6 +72,48 @@ class TestDrugEndpoints:
         assert "data" in data
         assert "meta" in data
 
+    @pytest.mark.asyncio
+    async def test_list_drugs_cursor_round_trip(
+        self, authenticated_client: AsyncClient, test_db
+    ):
+        """Test that following next_cursor continues the (name, id) order."""
+        async with test_db() as session:
+            from models.companies import Company
+            from models.drugs import Drug, DrugStatusEnum
+
+            company = Company(name="Cursor Pharma", country="United States")
+            session.add(company)
+            await session.flush()
+
+            # The middle name lands on the page boundary and carries the
+            # cursor delimiter, so the minted cursor must survive it
+            for name in ["Alpha Drug", "Beta|Drug", "Gamma Drug"]:
+                session.add(
+                    Drug(
+                        name=name,
+                        status=DrugStatusEnum.APPROVED,
+                        therapeutic_area="oncology",
+                        company_id=company.id,
+                    )
+                )
+            await session.commit()
+
+        response = await authenticated_client.get("/drugs/?limit=2")
+
+        assert response.status_code == 200
+        page_one = response.json()
+        assert [d["name"] for d in page_one["data"]] == ["Alpha Drug", "Beta|Drug"]
+
+        cursor = page_one["meta"]["next_cursor"]
+        assert cursor is not None
+
+        response = await authenticated_client.get(f"/drugs/?limit=2&cursor={cursor}")
+
+        assert response.status_code == 200
+        page_two = response.json()
+        assert [d["name"] for d in page_two["data"]] == ["Gamma Drug"]
+        assert page_two["meta"]["next_cursor"] is None
+
     @pytest.mark.asyncio
     async def test_list_drugs_invalid_page(self, authenticated_client: AsyncClient):
         """Test listing drugs with invalid page parameter."""
@@ -171,6 +214,61 @@ class TestDrugEndpoints:
         assert meta["page"] == 2
         assert meta["limit"] == 100
 
+    @pytest.mark.asyncio
+    async def test_get_drug_adverse_events_cursor_round_trip(
+        self, authenticated_client: AsyncClient, test_db
+    ):
+        """Test that adverse-event pages follow the (created_at, id) order."""
+        async with test_db() as session:
+            from models.companies import Company
+            from models.drugs import AdverseEvent, Drug, DrugStatusEnum
+
+            company = Company(name="Cursor Pharma", country="United States")
+            session.add(company)
+            await session.flush()
+
+            drug = Drug(
+                name="Cursor Drug",
+                status=DrugStatusEnum.APPROVED,
+                therapeutic_area="oncology",
+                company_id=company.id,
+            )
+            session.add(drug)
+            await session.flush()
+            drug_id = drug.id
+
+            base = datetime(2026, 1, 1)
+            for offset, term in enumerate(["Nausea", "Headache", "Fatigue"]):
+                session.add(
+                    AdverseEvent(
+                        drug_id=drug_id,
+                        event_term=term,
+                        seriousness="non_serious",
+                        created_at=base + timedelta(days=offset),
+                    )
+                )
+            await session.commit()
+
+        response = await authenticated_client.get(
+            f"/drugs/{drug_id}/adverse-events?limit=2"
+        )
+
+        assert response.status_code == 200
+        page_one = response.json()
+        assert [e["event_term"] for e in page_one["data"]] == ["Fatigue", "Headache"]
+
+        cursor = page_one["meta"]["next_cursor"]
+        assert cursor is not None
+
+        response = await authenticated_client.get(
+            f"/drugs/{drug_id}/adverse-events?limit=2&cursor={cursor}"
+        )
+
+        assert response.status_code == 200
+        page_two = response.json()
+        assert [e["event_term"] for e in page_two["data"]] == ["Nausea"]
+        assert page_two["meta"]["next_cursor"] is None
+
     @pytest.mark.asyncio
     async def test_get_new_drugs_default(self, authenticated_client: AsyncClient):
         """Test getting new drugs with default parameters."""
@@ -10,10 +10,6 @@ from pathlib import Path
 from typing import Any, Dict
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-
 class MockFastAPI:
     """Mock FastAPI application for testing."""
 
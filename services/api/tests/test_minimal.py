@@ -9,10 +9,6 @@ import unittest
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-
 class TestAPIStructure(unittest.TestCase):
     """Test the basic API structure and imports."""
 